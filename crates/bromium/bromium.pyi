@@ -202,12 +202,22 @@ class WinDriver:
     - __str__(self) -> str: Returns a string representation of the Windriver instance.
     - get_timeout(self) -> int: Returns the current timeout value in milliseconds.
     - set_timeout(self, timeout_ms: int) -> None: Sets a new timeout value in milliseconds.
-    - get_curser_pos(self) -> tuple[int, int]: Returns the current cursor position.
+    - get_cursor_pos(self) -> tuple[int, int]: Returns the current cursor position.
+    - get_curser_pos(self) -> tuple[int, int]: Deprecated alias of get_cursor_pos().
     - get_ui_element(self, x: int, y: int) -> Element: Returns the UI Element at the given coordinates.
+    - get_ui_element_at_cursor(self) -> Element: Returns the UI element under the mouse cursor.
+    - describe_cursor(self) -> tuple[int, int, str, str, int, list[int]]: Returns the cursor position and the UI element under it in one call.
     - get_screen_context(self) -> ScreenContext: Returns the screen context information.
     - take_screenshot(self) -> str: Takes a screenshot of the current screen, saves it and returns the path to the file created.
-    - launch_or_activate_app(self, app_path: str, xpath: str) -> bool: Launches or activates an application.
+    - launch_or_activate_app(self, app_path: str, xpath: str, skip_verify: bool = False) -> bool: Launches or activates an application.
+    - launch_app(self, app_path: str, xpath: str) -> int | None: Launches or activates an application and returns its window handle.
+    - activate_app(self, handle: int) -> bool: Activates an application window by its handle.
+    - wait_for_focus(self, handle: int, timeout_ms: int) -> bool: Waits until the application owning the given window is in the foreground.
+    - wait_until_idle(self, handle: int, timeout_ms: int = 3000) -> bool: Waits until the application owning the given window is idle.
     - refresh(self) -> None: Refreshes the internal UI tree representation.
+    - close(self) -> None: Closes the driver and frees the singleton instance.
+
+    WinDriver can be used as a context manager; the driver is closed when the `with` block is left.
     """
     
     def __init__(self, timeout_ms: int) -> None:
@@ -255,10 +265,24 @@ class WinDriver:
         """
         pass
 
-    def get_curser_pos(self) -> tuple[int, int]:
+    def get_cursor_pos(self) -> tuple[int, int]:
         """
         Returns the current cursor position as a tuple of (x, y) coordinates.
         
+        The position is given in physical screen coordinates, the same coordinates
+        used for the UI elements, independent of the monitor's scaling.
+        
+        Returns:
+        - tuple[int, int]: The current cursor position as (x, y) coordinates.
+        """
+        pass
+
+    def get_curser_pos(self) -> tuple[int, int]:
+        """
+        Deprecated alias of get_cursor_pos().
+        
+        Emits a DeprecationWarning.
+        
         Returns:
         - tuple[int, int]: The current cursor position as (x, y) coordinates.
         """
@@ -277,6 +301,36 @@ class WinDriver:
         """
         pass
 
+    def get_ui_element_at_cursor(self) -> 'Element':
+        """
+        Returns the UI element under the mouse cursor.
+        
+        The cursor position is read and the element resolved in a single call, replacing
+        get_cursor_pos() followed by get_ui_element(x, y).
+        
+        Returns:
+        - Element: The UI element under the mouse cursor.
+        
+        Raises:
+        - ValueError: If no element is found at the cursor position.
+        """
+        pass
+
+    def describe_cursor(self) -> tuple[int, int, str, str, int, list[int]]:
+        """
+        Returns the cursor position together with the UI element under the cursor.
+        
+        The cursor position and the element are resolved in a single call, which avoids
+        calling get_cursor_pos(), get_ui_element() and the Element getters one by one.
+        
+        Returns:
+        - tuple[int, int, str, str, int, list[int]]: (x, y, name, xpath, handle, runtime_id) of the element under the cursor.
+        
+        Raises:
+        - ValueError: If no element is found at the cursor position.
+        """
+        pass
+
     def get_ui_element_by_xpath(self, xpath: str) -> 'Element':
         """
         Returns the Windows UI Automation API UI element of the window at the given xpath. As an xpath
@@ -321,24 +375,95 @@ class WinDriver:
         """
         pass
 
-    def launch_or_activate_app(self, app_path: str, xpath: str) -> bool:
+    def launch_or_activate_app(self, app_path: str, xpath: str, skip_verify: bool = False) -> bool:
         """
         Launch or activate an application using its path and an XPath.
         
         This method will:
         1. Try to find and activate an existing window that matches the application name or XPath
         2. If no matching window is found, launch the application from the provided path
-        3. Wait for the application window to appear and bring it to the foreground
+        3. Wait for the application window to appear (up to 15 seconds) and bring it to the foreground
+        
+        The window activated for an application is remembered. On later calls it is activated
+        directly if it still exists and its title still matches the window names in the XPath.
         
         Parameters:
         - app_path (str): Full path to the application executable
         - xpath (str): XPath that identifies an element in the application window
+        - skip_verify (bool): Activate the remembered window without checking it against the XPath (default False)
         
         Returns:
         - bool: True if the application was successfully launched or activated
         """
         pass
 
+    def launch_app(self, app_path: str, xpath: str) -> int | None:
+        """
+        Launch or activate an application and return the handle of its window.
+        
+        Works like launch_or_activate_app, but returns the handle of the window that was
+        brought to the foreground so that it can later be reactivated with activate_app
+        without searching for the window again.
+        
+        Parameters:
+        - app_path (str): Full path to the application executable
+        - xpath (str): XPath that identifies an element in the application window
+        
+        Returns:
+        - int | None: The window handle, or None if no application window was found
+        
+        Raises:
+        - TimeoutError: If the application was started but its window did not appear in time.
+          The process keeps running, so calling launch_app again would start a second instance.
+        """
+        pass
+
+    def activate_app(self, handle: int) -> bool:
+        """
+        Activate an application window by its handle.
+        
+        Parameters:
+        - handle (int): The window handle, e.g. as returned by launch_app
+        
+        Returns:
+        - bool: True if the window exists and was activated, False otherwise
+        """
+        pass
+
+    def wait_for_focus(self, handle: int, timeout_ms: int) -> bool:
+        """
+        Wait until the application owning the given window is in the foreground.
+        
+        The wait is driven by foreground change events and returns as soon as any window
+        of the application has the focus, so no fixed sleep is needed after launching it.
+        
+        Parameters:
+        - handle (int): The window handle, e.g. as returned by launch_app
+        - timeout_ms (int): Maximum time to wait in milliseconds
+        
+        Returns:
+        - bool: True if the application got the focus within the timeout, False otherwise
+        """
+        pass
+
+    def wait_until_idle(self, handle: int, timeout_ms: int = 3000) -> bool:
+        """
+        Wait until the application owning the given window is idle.
+        
+        The application is considered idle once it has processed its pending input and
+        none of its windows changed for 300 ms, or for the rest of the timeout if that is
+        shorter. Use this instead of a fixed sleep after launching or activating an
+        application.
+        
+        Parameters:
+        - handle (int): The window handle, e.g. as returned by launch_app
+        - timeout_ms (int): Maximum time to wait in milliseconds (default 3000)
+        
+        Returns:
+        - bool: True if the application became idle within the timeout, False otherwise
+        """
+        pass
+
     def refresh(self) -> None:
         """
         Refreshes the internal UI tree representation.
@@ -351,6 +476,25 @@ class WinDriver:
         """
         pass
 
+    def close(self) -> None:
+        """
+        Closes the WinDriver instance and frees the global singleton, so a new
+        WinDriver can be created afterwards.
+        """
+        pass
+
+    def __enter__(self) -> 'WinDriver':
+        """
+        Returns the driver itself for use in a `with` block.
+        """
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        """
+        Closes the driver when the `with` block is left. Exceptions are not suppressed.
+        """
+        pass
+
 
 class ScreenInfo:
     """
@@ -1,6 +1,4 @@
 from bromium import WinDriver
-import time
-import os
 
 def test_app_launch():
     print("Testing bromium app launch/activation functionality...")
@@ -20,37 +18,45 @@ def test_app_launch():
     # This is a sample XPath for the Teams window and the "Besprechung" button
     xpath = r'/Pane[@ClassName=\"#32769\"][@Name=\"Desktop 1\"]/Window[@ClassName=\"TeamsWebView\"][@Name=\"Besprechungen | Microsoft Teams\"]/Pane[@ClassName=\"Chrome_WidgetWin_0\"]/Pane[@ClassName=\"Chrome_WidgetWin_1\"][@Name=\"Besprechungen | Microsoft Teams\"]/Pane[@ClassName=\"BrowserRootView\"][@Name=\"Besprechungen | Microsoft Teams – Webinhalt – Profilo 3\"]/Pane[@ClassName=\"NonClientView\"]/Pane[@ClassName=\"EmbeddedBrowserFrameView\"]/Pane[@ClassName=\"BrowserView\"]/Pane[@ClassName=\"SidebarContentsSplitView\"]/Pane[@ClassName=\"SidebarContentsSplitView\"]/Pane[@ClassName=\"View\"]/Document[@Name=\"Besprechungen | Microsoft Teams\"][@AutomationId=\"RootWebArea\"]/Group/Group[@AutomationId=\"app\"]/Group/Group[@Name=\"Apps\"]/Group[@Name=\"Besprechungen\"]/Button[@Name=\"Besprechungen\"][@AutomationId=\"40472f6e-248f-4599-842c-ff3ed8f0ae34\"]'
 
-    file_name = os.path.basename(app_path)
+    file_name = app_path.rpartition("\\")[2].rpartition("/")[2]
     print(f"Launching/activating {file_name} with path: {app_path}")
     
-    # Try to launch or activate the application
-    success = driver.launch_or_activate_app(app_path, xpath)
-    print(f"First attempt result: {'Success' if success else 'Failed'}")
+    # Try to launch or activate the application; the window handle is kept for reactivation
+    try:
+        handle = driver.launch_app(app_path, xpath)
+        print(f"First attempt result: {'Success' if handle is not None else 'Failed'}")
+    except TimeoutError as e:
+        # The application is running but has no window yet, launching again would start a second instance
+        handle = None
+        print(f"First attempt result: {e}")
     
-    if success:
-        print(f"{file_name} should now be in focus")
+    if handle is not None:
+        # Make sure the application has the focus before interacting with it
+        focused = driver.wait_for_focus(handle, 5000)
+        print(f"{file_name} in focus: {focused}")
         
-        # Wait a moment to observe the result
-        time.sleep(3)
+        # Wait until the application has finished loading
+        driver.wait_until_idle(handle, 3000)
         
         # Test getting the UI element at the current cursor position
-        x, y = driver.get_curser_pos()
-        print(f"Current cursor position: ({x}, {y})")
-        
-        # Try to get UI element at cursor position
         try:
-            element = driver.get_ui_element(x, y)
+            element = driver.get_ui_element_at_cursor()
             print(f"UI Element at cursor: {element.get_name()}")
         except Exception as e:
             print(f"Error getting UI element: {e}")
-    
-    # Test again to demonstrate activation of already running app
-    print("\nTesting activation of already running app...")
-    success2 = driver.launch_or_activate_app(app_path, xpath)
-    print(f"Second attempt result: {'Success' if success2 else 'Failed'}")
-    
-    # Wait to observe
-    time.sleep(2)
+        
+        # Test again to demonstrate activation of already running app
+        print("\nTesting activation of already running app...")
+        success2 = driver.activate_app(handle)
+        print(f"Second attempt result: {'Success' if success2 else 'Failed'}")
+        
+        # The window found by launch_app is remembered for this app path, so it can also be
+        # reactivated by path without checking the XPath again
+        success3 = driver.launch_or_activate_app(app_path, xpath, skip_verify=True)
+        print(f"Third attempt result (skip_verify): {'Success' if success3 else 'Failed'}")
+        
+        # Wait until the application has settled
+        driver.wait_until_idle(handle, 2000)
     
     print("Test completed!")
 
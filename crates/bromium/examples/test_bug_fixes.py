@@ -29,7 +29,7 @@ def test_bug_1_state_synchronization():
     print(f"✓ Driver created: {repr(driver)}")
 
     # Get first element
-    x, y = driver.get_curser_pos()
+    x, y = driver.get_cursor_pos()
     print(f"✓ Cursor at: ({x}, {y})")
 
     element1 = driver.get_ui_element(x, y)
@@ -63,7 +63,7 @@ def test_bug_2_xpath_recovery():
     driver = WinDriver(timeout_ms=5000)
     print(f"✓ Driver created with auto-refresh enabled: {driver.get_auto_refresh()}")
 
-    x, y = driver.get_curser_pos()
+    x, y = driver.get_cursor_pos()
     element = driver.get_ui_element(x, y)
 
     print(f"✓ Element found: {element.get_name()}")
@@ -166,7 +166,7 @@ def test_all_fixes_integration():
     print(f"✓ Driver: {repr(driver)}")
 
     # Get element
-    x, y = driver.get_curser_pos()
+    x, y = driver.get_cursor_pos()
     element = driver.get_ui_element(x, y)
     print(f"✓ Element: {element.get_name()}")
     print(f"  XPath: {element.get_xpath()}")
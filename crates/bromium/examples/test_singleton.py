@@ -50,7 +50,7 @@ def test_close_and_recreate():
     print(f"✓ Driver 1 created: {repr(driver1)}")
 
     # Get an element to verify driver works
-    x, y = driver1.get_curser_pos()
+    x, y = driver1.get_cursor_pos()
     print(f"✓ Cursor position: ({x}, {y})")
 
     # Close the first driver
@@ -68,7 +68,7 @@ def test_close_and_recreate():
         return False
 
     # Verify the new driver works
-    x2, y2 = driver2.get_curser_pos()
+    x2, y2 = driver2.get_cursor_pos()
     print(f"✓ New driver working, cursor at: ({x2}, {y2})")
 
     # Clean up
@@ -95,7 +95,7 @@ def test_singleton_prevents_state_issues():
     print(f"✓ Driver created: {repr(driver)}")
 
     # Get an element
-    x, y = driver.get_curser_pos()
+    x, y = driver.get_cursor_pos()
     element1 = driver.get_ui_element(x, y)
     print(f"✓ Element 1: {element1.get_name()}")
 
@@ -140,7 +140,7 @@ def test_proper_usage_pattern():
 
     # Use it for multiple tasks
     print("2. Use it for multiple automation tasks")
-    x, y = driver.get_curser_pos()
+    x, y = driver.get_cursor_pos()
     elem1 = driver.get_ui_element(x, y)
     print(f"   ✓ Task 1: Found element '{elem1.get_name()}'")
 
@@ -164,39 +164,38 @@ def test_proper_usage_pattern():
 
 def test_context_manager_pattern():
     """
-    Show that manual close is needed (no __enter__/__exit__ yet)
+    Show that the driver is closed automatically when used as a context manager
     """
     print("\n" + "=" * 70)
     print("Test 5: Resource Management")
     print("=" * 70)
 
-    print("Note: WinDriver does not yet support context managers.")
-    print("You must call close() explicitly.\n")
+    print("WinDriver supports the context manager protocol.")
+    print("close() is called automatically when the with block is left.\n")
 
-    # Manual cleanup pattern
+    # Context manager pattern
     print("Recommended pattern:")
     print("```python")
-    print("driver = None")
-    print("try:")
-    print("    driver = WinDriver(5000)")
+    print("with WinDriver(5000) as driver:")
     print("    # ... do work ...")
-    print("finally:")
-    print("    if driver:")
-    print("        driver.close()")
     print("```\n")
 
     # Demonstrate
-    driver = None
-    try:
-        driver = WinDriver(timeout_ms=5000)
+    with WinDriver(timeout_ms=5000) as driver:
         print(f"✓ Driver created: {repr(driver)}")
         # Do some work
-        x, y = driver.get_curser_pos()
-        print(f"✓ Did some work (cursor at {x}, {y})")
-    finally:
-        if driver:
-            driver.close()
-            print("✓ Driver cleaned up in finally block")
+        x, y, name, _xpath, _handle, _runtime_id = driver.describe_cursor()
+        print(f"✓ Did some work (cursor at {x}, {y} over '{name}')")
+    print("✓ Driver cleaned up when leaving the with block")
+
+    # The singleton has been freed, so a new driver can be created
+    try:
+        driver2 = WinDriver(timeout_ms=5000)
+        driver2.close()
+        print("✓ New driver could be created after the with block")
+    except RuntimeError as e:
+        print(f"✗ ERROR: Driver was not closed by the with block: {e}")
+        return False
 
     print("\n✅ Resource management test PASSED")
     return True
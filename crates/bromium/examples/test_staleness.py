@@ -21,7 +21,7 @@ def test_auto_refresh():
     print(f"Auto-refresh enabled: {driver.get_auto_refresh()}")
 
     # Get current cursor position
-    x, y = driver.get_curser_pos()
+    x, y = driver.get_cursor_pos()
     print(f"Cursor position: ({x}, {y})")
 
     # Get element at cursor
@@ -52,7 +52,7 @@ def test_manual_refresh():
     print(f"Driver created: {repr(driver)}")
 
     # Get cursor position and element
-    x, y = driver.get_curser_pos()
+    x, y = driver.get_cursor_pos()
     element = driver.get_ui_element(x, y)
     print(f"Element found: {element.get_name()}")
 
@@ -76,7 +76,7 @@ def test_auto_refresh_disabled():
     print(f"Auto-refresh enabled: {driver.get_auto_refresh()}")
 
     # Get cursor position
-    x, y = driver.get_curser_pos()
+    x, y = driver.get_cursor_pos()
     element = driver.get_ui_element(x, y)
     print(f"Element found: {element.get_name()}")
 
@@ -14,7 +14,7 @@ print(f"Primary screen information: {repr(screen_context.get_primary_screen())}"
 # print(f"Screen scale: {screen_context.get_screen_scale()}")
 
 # Get current cursor position
-x, y = driver.get_curser_pos()
+x, y = driver.get_cursor_pos()
 print(f"Current cursor position: ({x}, {y})")
 
 # Get UI element at specific coordinates
@@ -1,45 +1,304 @@
-use std::ffi::OsStr;
-use std::os::windows::ffi::OsStrExt;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 use std::thread;
 use std::process::Command;
-use regex::Regex;
+use std::collections::HashMap;
+use std::ops::Range;
+use std::sync::{Arc, LazyLock};
+use std::sync::mpsc::{channel, Receiver, RecvTimeoutError, Sender};
+use parking_lot::Mutex;
+use memchr::{memchr, memchr2, memchr3};
 
 use winapi::um::winuser::{
-    FindWindowW, SetForegroundWindow, GetForegroundWindow, ShowWindow, BringWindowToTop,
+    SetForegroundWindow, GetForegroundWindow, ShowWindow, BringWindowToTop,
     SW_RESTORE, SW_SHOW, GetWindowThreadProcessId, AttachThreadInput,
     WM_SYSCOMMAND, SC_RESTORE, SendMessageW, EnumWindows, GetWindowTextW, 
     GetWindowTextLengthW, IsWindowVisible, GetWindowPlacement, 
-    WINDOWPLACEMENT, SW_SHOWMINIMIZED, keybd_event, VK_MENU, KEYEVENTF_KEYUP
+    WINDOWPLACEMENT, SW_SHOWMINIMIZED, keybd_event, VK_MENU, KEYEVENTF_KEYUP, IsWindow,
+    WaitForInputIdle, AllowSetForegroundWindow, SwitchToThisWindow
 };
+use winapi::um::processthreadsapi::OpenProcess;
+use winapi::um::handleapi::CloseHandle;
+use winapi::um::winnt::{SYNCHRONIZE, PROCESS_QUERY_LIMITED_INFORMATION};
+use winapi::shared::winerror::WAIT_TIMEOUT;
 use winapi::shared::windef::HWND;
 use winapi::shared::minwindef::{BOOL, LPARAM};
+use win_event_hook::WinEventHook;
+use win_event_hook::events::{Event, NamedEvent};
+use win_event_hook::handles::OpaqueHandle;
+use win_event_hook::handles::builtins::WindowHandle;
 use log::{debug, error, info, trace, warn};
 
-// Extract window names from XPath
-fn extract_window_names_from_xpath(xpath: &str) -> Vec<String> {
-    debug!("Extract window names from XPath: {}", xpath);
+// Object and child ids of WinEvents raised for a window itself
+const OBJID_WINDOW: i32 = 0;
+const CHILDID_SELF: i32 = 0;
 
-    let mut window_names = Vec::new();
-    
-    // Try various patterns to extract window names
-    let patterns = [
-        r#"/Window\[@Name="([^"]+)"\]"#,
-        r#"Window\[@Name="([^"]+)"\]"#,
-        r#"\[Name="([^"]+)"\]"#,
-    ];
-    
-    for pattern in &patterns {
-        if let Ok(re) = Regex::new(pattern) {
-            for cap in re.captures_iter(xpath) {
-                if let Some(window_name) = cap.get(1) {
-                    window_names.push(window_name.as_str().to_string());
+// Overall bound for waiting on the window of a newly launched application
+const LAUNCH_WINDOW_TIMEOUT: Duration = Duration::from_secs(15);
+// Upper bound for confirming that an activated window reached the foreground
+const FOCUS_CONFIRM_TIMEOUT: Duration = Duration::from_millis(100);
+// Period without window changes after which an application is considered idle
+const IDLE_QUIET_PERIOD: Duration = Duration::from_millis(300);
+// Rescan interval used only if the window event hook cannot be installed
+const LAUNCH_POLL_INTERVAL: Duration = Duration::from_millis(500);
+// Longest wait actually performed; larger timeouts would overflow Instant
+const MAX_WAIT: Duration = Duration::from_secs(365 * 24 * 60 * 60);
+
+// Upper bound for the number of memoized XPaths before the cache is reset
+const XPATH_CACHE_CAPACITY: usize = 128;
+
+// Window handle and process id of the last window activated per application path.
+// The handle is stored as an integer as raw HWNDs cannot be shared between threads.
+static APP_WINDOW_CACHE: LazyLock<Mutex<HashMap<String, (isize, u32)>>> = LazyLock::new(|| Mutex::new(HashMap::new()));
+
+// Parsed XPaths keyed by the raw XPath string, so repeated locators skip parsing
+static XPATH_CACHE: LazyLock<Mutex<HashMap<String, Arc<CompiledXPath>>>> = LazyLock::new(|| Mutex::new(HashMap::new()));
+
+// Byte range of a value within the XPath string
+type Span = Range<usize>;
+
+/// A single XPath step. Only the parts used to find the application window are
+/// kept, as byte ranges into the XPath.
+#[derive(Debug, Default, Clone)]
+struct StepPredicates {
+    control_type: Span,
+    name: Option<Span>,
+}
+
+/// The parts of an XPath needed to locate the application window
+#[derive(Debug)]
+pub struct CompiledXPath {
+    window_names: Vec<String>,
+}
+
+impl CompiledXPath {
+    fn new(xpath: &str) -> Self {
+        let steps = parse_xpath_steps(xpath);
+
+        // The names of the Window steps identify the application window
+        let mut window_names: Vec<String> = Vec::new();
+        for step in &steps {
+            if &xpath[step.control_type.clone()] != "Window" {
+                continue;
+            }
+            if let Some(name) = step.name.clone().map(|span| &xpath[span]) {
+                if !name.is_empty() && !window_names.iter().any(|window_name| window_name == name) {
+                    window_names.push(name.to_string());
                 }
             }
         }
+        debug!("Compiled XPath with {} steps", steps.len());
+
+        CompiledXPath { window_names }
+    }
+
+    pub fn window_names(&self) -> &[String] {
+        &self.window_names
+    }
+}
+
+/// Parse an XPath once and return the memoized result on subsequent calls
+pub fn compile_xpath(xpath: &str) -> Arc<CompiledXPath> {
+    if let Some(compiled) = XPATH_CACHE.lock().get(xpath) {
+        trace!("Using cached compiled XPath");
+        return Arc::clone(compiled);
+    }
+
+    let compiled = Arc::new(CompiledXPath::new(xpath));
+
+    let mut cache = XPATH_CACHE.lock();
+    if cache.len() >= XPATH_CACHE_CAPACITY {
+        debug!("XPath cache reached {} entries, clearing it", XPATH_CACHE_CAPACITY);
+        cache.clear();
+    }
+    cache.insert(xpath.to_string(), Arc::clone(&compiled));
+    compiled
+}
+
+/// Drop all memoized XPaths
+pub fn clear_xpath_cache() {
+    XPATH_CACHE.lock().clear();
+}
+
+/// Forget the windows remembered for previously activated applications
+pub fn clear_app_window_cache() {
+    APP_WINDOW_CACHE.lock().clear();
+}
+
+// Return the process id owning the window, or None if the window no longer exists
+fn get_window_process_id(hwnd: HWND) -> Option<u32> {
+    unsafe {
+        if IsWindow(hwnd) == 0 {
+            return None;
+        }
+        let mut pid: u32 = 0;
+        if GetWindowThreadProcessId(hwnd, &mut pid) == 0 {
+            return None;
+        }
+        Some(pid)
+    }
+}
+
+// Return the window remembered for the application if it still exists, belongs to the
+// same process and is visible; stale entries are dropped
+fn get_cached_app_window(app_path: &str) -> Option<HWND> {
+    let mut cache = APP_WINDOW_CACHE.lock();
+    let (raw_hwnd, cached_pid) = *cache.get(app_path)?;
+    let hwnd = raw_hwnd as HWND;
+
+    let is_valid = get_window_process_id(hwnd) == Some(cached_pid)
+        && unsafe { IsWindowVisible(hwnd) } != 0;
+    if is_valid {
+        Some(hwnd)
+    } else {
+        debug!("Cached window for '{}' is stale", app_path);
+        cache.remove(app_path);
+        None
+    }
+}
+
+// Check that the window still shows the UI the XPath refers to, i.e. that its title
+// contains one of the XPath's window names (if the XPath names any window)
+fn window_matches_xpath(hwnd: HWND, xpath: &str) -> bool {
+    let compiled_xpath = compile_xpath(xpath);
+    let xpath_window_names = compiled_xpath.window_names();
+    if xpath_window_names.is_empty() {
+        return true;
+    }
+
+    let window_title = get_window_title(hwnd).unwrap_or_default().to_lowercase();
+    xpath_window_names.iter().any(|name| window_title.contains(name.to_lowercase().as_str()))
+}
+
+/// Result of launching or activating an application. The window handle is stored
+/// as an integer as raw HWNDs cannot be shared between threads.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum LaunchOutcome {
+    /// An application window was found and activated
+    Activated(isize),
+    /// The process with the given id was started, but no window was found before the timeout
+    Started(u32),
+    Failed,
+}
+
+fn activation_outcome(activated: bool, hwnd: HWND) -> LaunchOutcome {
+    if activated { LaunchOutcome::Activated(hwnd as isize) } else { LaunchOutcome::Failed }
+}
+
+// Activate the window and remember it for subsequent calls with the same application path
+fn activate_and_remember_window(app_path: &str, hwnd: HWND, window_title: &str) -> bool {
+    let result = activate_window(hwnd, window_title);
+    if result {
+        if let Some(pid) = get_window_process_id(hwnd) {
+            APP_WINDOW_CACHE.lock().insert(app_path.to_string(), (hwnd as isize, pid));
+        }
+    }
+    result
+}
+
+// Split an XPath into its steps in a single pass. Boundaries are found with memchr;
+// values quoted with ' (as written by the XPath generator) or " are taken as is, so
+// `/`, `[` and `]` within names need no special care. Quotes escaped as \" (as in
+// XPaths copied from string literals) are accepted too.
+fn parse_xpath_steps(xpath: &str) -> Vec<StepPredicates> {
+    debug!("Parse XPath steps: {}", xpath);
+
+    let bytes = xpath.as_bytes();
+    let mut steps = Vec::new();
+    let mut pos = 0;
+
+    while pos < bytes.len() {
+        if bytes[pos] == b'/' {
+            pos += 1;
+            continue;
+        }
+
+        // The node name (control type) runs up to the first predicate or the next step
+        let name_end = memchr2(b'[', b'/', &bytes[pos..]).map_or(bytes.len(), |i| pos + i);
+        let mut step = StepPredicates { control_type: pos..name_end, ..Default::default() };
+        pos = name_end;
+
+        while pos < bytes.len() && bytes[pos] == b'[' {
+            pos = parse_step_predicate(xpath, pos + 1, &mut step);
+        }
+        steps.push(step);
+    }
+
+    steps
+}
+
+// Parse the predicate starting after its '[' into the step and return the position
+// after its closing ']'
+fn parse_step_predicate(xpath: &str, start: usize, step: &mut StepPredicates) -> usize {
+    let bytes = xpath.as_bytes();
+
+    let Some(eq) = memchr2(b'=', b']', &bytes[start..]).map(|i| start + i) else {
+        return bytes.len();
+    };
+    if bytes[eq] == b']' {
+        // Not an attribute comparison, e.g. a position
+        return eq + 1;
+    }
+    let attribute = xpath[start..eq].trim().trim_start_matches('@');
+
+    let mut value_start = eq + 1;
+    let escaped = bytes.get(value_start) == Some(&b'\\');
+    if escaped {
+        value_start += 1;
+    }
+    let quote_char = match bytes.get(value_start) {
+        Some(&quote_char) if quote_char == b'"' || quote_char == b'\'' => quote_char,
+        // Unquoted values (coordinates, sizes) are not used to identify elements
+        _ => return skip_to_predicate_end(bytes, value_start),
+    };
+    value_start += 1;
+
+    let Some(quote) = memchr(quote_char, &bytes[value_start..]).map(|i| value_start + i) else {
+        return bytes.len();
+    };
+    let value_end = if escaped && quote > value_start && bytes[quote - 1] == b'\\' { quote - 1 } else { quote };
+
+    if attribute == "Name" {
+        step.name = Some(value_start..value_end);
+    }
+
+    skip_to_predicate_end(bytes, quote + 1)
+}
+
+// Return the position after the ']' closing the current predicate. Quoted values are
+// skipped as a whole, so a ']' within them does not end the predicate.
+fn skip_to_predicate_end(bytes: &[u8], mut pos: usize) -> usize {
+    while let Some(i) = memchr3(b']', b'"', b'\'', &bytes[pos..]) {
+        let found = pos + i;
+        if bytes[found] == b']' {
+            return found + 1;
+        }
+        match memchr(bytes[found], &bytes[found + 1..]) {
+            Some(j) => pos = found + 1 + j + 1,
+            None => break,
+        }
+    }
+    bytes.len()
+}
+
+// Get the title of a window, or None if it has no title
+fn get_window_title(hwnd: HWND) -> Option<String> {
+    unsafe {
+        // Get window title length
+        let length = GetWindowTextLengthW(hwnd);
+        if length <= 0 {
+            return None;
+        }
+
+        // Get window title
+        let mut buffer = vec![0u16; length as usize + 1];
+        let copied = GetWindowTextW(hwnd, buffer.as_mut_ptr(), buffer.len() as i32);
+        if copied <= 0 {
+            return None;
+        }
+        
+        // Convert to String
+        Some(String::from_utf16_lossy(&buffer[..copied as usize]))
     }
-    
-    window_names
 }
 
 // Scan for all windows on the system
@@ -55,16 +314,7 @@ fn scan_for_all_windows() -> Vec<(String, HWND)> {
     extern "system" fn collect_all_windows(hwnd: HWND, lparam: LPARAM) -> BOOL {
         unsafe {
             if IsWindowVisible(hwnd) != 0 {
-                // Get window title length
-                let length = GetWindowTextLengthW(hwnd);
-                if length > 0 {
-                    // Get window title
-                    let mut buffer = vec![0u16; length as usize + 1];
-                    GetWindowTextW(hwnd, buffer.as_mut_ptr(), buffer.len() as i32);
-                    
-                    // Convert to String
-                    let window_title = String::from_utf16_lossy(&buffer[..length as usize]);
-                    
+                if let Some(window_title) = get_window_title(hwnd) {
                     // Add to our collection
                     let data = &mut *(lparam as *mut AllWindowsData);
                     data.windows.push((window_title, hwnd));
@@ -89,74 +339,12 @@ fn scan_for_all_windows() -> Vec<(String, HWND)> {
     data.windows
 }
 
-// Find window with partial name
-fn find_window_with_partial_name(name_part: &str) -> Option<String> {
-    debug!("Find window with partial name: '{}'", name_part);
-
-    struct WindowSearchData {
-        search_term: String,
-        found_name: Option<String>,
-    }
-    
-    extern "system" fn search_callback(hwnd: HWND, lparam: LPARAM) -> BOOL {
-        unsafe {
-            if IsWindowVisible(hwnd) != 0 {
-                let length = GetWindowTextLengthW(hwnd);
-                if length > 0 {
-                    let mut buffer = vec![0u16; length as usize + 1];
-                    GetWindowTextW(hwnd, buffer.as_mut_ptr(), buffer.len() as i32);
-                    
-                    let window_title = String::from_utf16_lossy(&buffer[..length as usize]);
-                    let data = &mut *(lparam as *mut WindowSearchData);
-                    
-                    if window_title.to_lowercase().contains(&data.search_term.to_lowercase()) {
-                        data.found_name = Some(window_title);
-                        return 0; // Stop enumeration
-                    }
-                }
-            }
-            1 // Continue enumeration
-        }
-    }
-    
-    let mut data = WindowSearchData {
-        search_term: name_part.to_string(),
-        found_name: None,
-    };
-    
-    unsafe {
-        EnumWindows(
-            Some(search_callback),
-            &mut data as *mut WindowSearchData as LPARAM
-        );
-    }
-    
-    match data.found_name {
-        Some(ref name) => {
-            debug!("Found window with partial name match: '{}'", name);
-        }
-        None => {
-            debug!("No window found with partial name: '{}'", name_part);
-        }
-    }
-    
-    data.found_name
-}
-
-// Activate window by name
-fn activate_window_by_name(window_name: &str) -> bool {
-    debug!("Activate window by name: '{}'", window_name);
+// Activate a window by the handle found during the window scan
+fn activate_window(hwnd: HWND, window_name: &str) -> bool {
+    debug!("Activate window: '{}' ({:?})", window_name, hwnd);
 
-    // Convert to wide string for Windows API
-    let window_name_wide: Vec<u16> = OsStr::new(window_name)
-        .encode_wide()
-        .chain(std::iter::once(0))
-        .collect();
-    
     unsafe {
-        let hwnd = FindWindowW(std::ptr::null(), window_name_wide.as_ptr());
         if hwnd != std::ptr::null_mut() {
-            trace!("Found window handle for: '{}'", window_name);
             // First, check if already in foreground
             let foreground_hwnd = GetForegroundWindow();
             if foreground_hwnd == hwnd {
@@ -211,10 +399,8 @@ fn activate_window_by_name(window_name: &str) -> bool {
                 keybd_event(VK_MENU as u8, 0, KEYEVENTF_KEYUP, 0);
             }
             
-            // Wait to confirm focus
-            thread::sleep(Duration::from_millis(100));
-            
-            if GetForegroundWindow() == hwnd {
+            // Wait to confirm focus; returns as soon as the window is in the foreground
+            if wait_for_foreground(|foreground_hwnd| foreground_hwnd == hwnd, FOCUS_CONFIRM_TIMEOUT) {
                 info!("Successfully brought window to foreground: '{}'", window_name);
                 return true;
             } else {
@@ -224,22 +410,241 @@ fn activate_window_by_name(window_name: &str) -> bool {
         }
     }
     
-    error!("Window not found for activation: '{}'", window_name);
+    error!("Invalid window handle for activation: '{}'", window_name);
     false // Window not found
 }
 
-/// Launch or activate an application based on its path and XPath
-/// Returns true if successful, false otherwise
-pub fn launch_or_activate_application(app_path: &str, xpath: &str) -> bool {
+// Install a WinEvent hook signalling whenever a top-level window is shown or
+// brought to the foreground
+fn install_window_event_hook() -> Option<(WinEventHook, Receiver<()>)> {
+    let (tx, rx): (Sender<()>, Receiver<()>) = channel();
+
+    let config = win_event_hook::Config::builder()
+        .skip_own_process()
+        .with_dedicated_thread()
+        .with_events(vec![
+            Event::Named(NamedEvent::ObjectShow),
+            Event::Named(NamedEvent::SystemForeground),
+        ])
+        .finish();
+
+    let handler = move |_ev: Event, _ohwnd: OpaqueHandle<WindowHandle>, id_object: i32, id_child: i32, _thread: u32, _time: u32| {
+        // Only the window object itself is of interest, not carets, cursors or children
+        if id_object == OBJID_WINDOW && id_child == CHILDID_SELF {
+            let _ = tx.send(());
+        }
+    };
+
+    match WinEventHook::install(config, handler) {
+        Ok(hook) => Some((hook, rx)),
+        Err(e) => {
+            warn!("Failed to install window event hook, falling back to polling: {:?}", e);
+            None
+        }
+    }
+}
+
+// Point in time a wait of the given length ends, with the length capped to MAX_WAIT
+fn deadline_after(timeout: Duration) -> Instant {
+    let now = Instant::now();
+    now.checked_add(timeout).unwrap_or(now + MAX_WAIT)
+}
+
+// Wait until the foreground window satisfies the predicate. The check is repeated
+// whenever the foreground window changes rather than polled on a fixed schedule.
+fn wait_for_foreground(is_target: impl Fn(HWND) -> bool, timeout: Duration) -> bool {
+    let deadline = deadline_after(timeout);
+    let (tx, rx): (Sender<()>, Receiver<()>) = channel();
+
+    let config = win_event_hook::Config::builder()
+        .with_dedicated_thread()
+        .with_events(vec![Event::Named(NamedEvent::SystemForeground)])
+        .finish();
+    let handler = move |_ev: Event, _ohwnd: OpaqueHandle<WindowHandle>, _id_object: i32, _id_child: i32, _thread: u32, _time: u32| {
+        let _ = tx.send(());
+    };
+    let mut hook = WinEventHook::install(config, handler).ok();
+    if hook.is_none() {
+        warn!("Failed to install foreground event hook, falling back to polling");
+    }
+
+    // Checked after the hook is installed so that a change in between is not missed
+    let mut found = is_target(unsafe { GetForegroundWindow() });
+    while !found {
+        let remaining = deadline.saturating_duration_since(Instant::now());
+        if remaining.is_zero() {
+            break;
+        }
+        if hook.is_some() {
+            if let Err(RecvTimeoutError::Disconnected) = rx.recv_timeout(remaining) {
+                break;
+            }
+        } else {
+            thread::sleep(remaining.min(Duration::from_millis(10)));
+        }
+        found = is_target(unsafe { GetForegroundWindow() });
+    }
+
+    if let Some(hook) = hook.as_mut() {
+        if let Err(e) = hook.uninstall() {
+            warn!("Failed to uninstall foreground event hook: {:?}", e);
+        }
+    }
+    found
+}
+
+/// Wait until a window of the process owning the given window is in the foreground
+/// Returns true if it got the focus within the timeout, false otherwise
+pub fn wait_for_window_focus(handle: isize, timeout: Duration) -> bool {
+    match get_window_process_id(handle as HWND) {
+        Some(pid) => wait_for_process_focus(pid, timeout),
+        None => {
+            warn!("Invalid window handle to wait for: {}", handle);
+            false
+        }
+    }
+}
+
+// Wait until a window of the given process is in the foreground
+fn wait_for_process_focus(pid: u32, timeout: Duration) -> bool {
+    debug!("Waiting up to {:?} for process {} to get the focus", timeout, pid);
+    let result = wait_for_foreground(|hwnd| get_window_process_id(hwnd) == Some(pid), timeout);
+    if result {
+        info!("Process {} is in the foreground", pid);
+    } else {
+        warn!("Process {} did not get the focus within {:?}", pid, timeout);
+    }
+    result
+}
+
+/// Wait until the application owning the given window is idle: it has finished
+/// processing its pending input and its windows did not change for a short quiet period
+/// Returns true if it became idle within the timeout, false otherwise
+pub fn wait_until_window_idle(handle: isize, timeout: Duration) -> bool {
+    let deadline = deadline_after(timeout);
+
+    let pid = match get_window_process_id(handle as HWND) {
+        Some(pid) => pid,
+        None => {
+            warn!("Invalid window handle to wait for: {}", handle);
+            return false;
+        }
+    };
+    debug!("Waiting up to {:?} for process {} to become idle", timeout, pid);
+
+    // Installed before waiting for input idle so that no change in between is missed
+    let (tx, rx): (Sender<()>, Receiver<()>) = channel();
+    let config = win_event_hook::Config::builder()
+        .skip_own_process()
+        .with_dedicated_thread()
+        .with_events(vec![
+            Event::Named(NamedEvent::ObjectCreate),
+            Event::Named(NamedEvent::ObjectDestroy),
+            Event::Named(NamedEvent::ObjectShow),
+            Event::Named(NamedEvent::ObjectHide),
+            Event::Named(NamedEvent::ObjectReorder),
+        ])
+        .finish();
+    let handler = move |_ev: Event, ohwnd: OpaqueHandle<WindowHandle>, id_object: i32, id_child: i32, _thread: u32, _time: u32| {
+        // Only changes of the windows themselves count; accessibility events of the
+        // elements inside them (e.g. in browser based apps) would never settle
+        if id_object == OBJID_WINDOW && id_child == CHILDID_SELF && get_window_process_id((*ohwnd).0 as HWND) == Some(pid) {
+            let _ = tx.send(());
+        }
+    };
+    let mut hook = WinEventHook::install(config, handler).ok();
+
+    // Wait for the application to finish processing its pending input
+    let mut input_idle = true;
+    unsafe {
+        let process = OpenProcess(SYNCHRONIZE | PROCESS_QUERY_LIMITED_INFORMATION, 0, pid);
+        if !process.is_null() {
+            // INFINITE is u32::MAX, so longer waits are clamped just below it
+            let remaining_ms = deadline.saturating_duration_since(Instant::now()).as_millis();
+            let remaining_ms = u32::try_from(remaining_ms).unwrap_or(u32::MAX - 1);
+            // Fails immediately for processes without a message queue, which is fine
+            input_idle = WaitForInputIdle(process, remaining_ms) != WAIT_TIMEOUT;
+            CloseHandle(process);
+        }
+    }
+
+    // Then wait until no window of the process changed for the quiet period
+    let idle = match &hook {
+        Some(_) => loop {
+            // With less than the quiet period left, staying quiet until the deadline
+            // is enough, so an already idle process is not reported as busy
+            let remaining = deadline.saturating_duration_since(Instant::now());
+            match rx.recv_timeout(remaining.min(IDLE_QUIET_PERIOD)) {
+                Ok(()) => {
+                    trace!("Process {} still changing its windows", pid);
+                    if Instant::now() >= deadline {
+                        break false;
+                    }
+                }
+                Err(RecvTimeoutError::Timeout) => break input_idle,
+                Err(RecvTimeoutError::Disconnected) => break input_idle,
+            }
+        },
+        None => {
+            warn!("Failed to install window event hook, only waiting for input idle");
+            input_idle
+        }
+    };
+
+    if let Some(hook) = hook.as_mut() {
+        if let Err(e) = hook.uninstall() {
+            warn!("Failed to uninstall window event hook: {:?}", e);
+        }
+    }
+
+    if idle {
+        info!("Process {} is idle", pid);
+    } else {
+        warn!("Process {} did not become idle within {:?}", pid, timeout);
+    }
+    idle
+}
+
+// Look for a window belonging to a newly launched application
+fn find_launched_window(xpath_window_names: &[String], app_name_lower: &str) -> Option<(String, HWND)> {
+    let new_windows = scan_for_all_windows();
+    trace!("Found {} windows after waiting", new_windows.len());
+
+    for (window_title, hwnd) in new_windows {
+        // First check XPath window names, then the app name
+        if xpath_window_names.iter().any(|xpath_name| window_title.contains(xpath_name.as_str())) {
+            debug!("Found new window matching XPath name: '{}'", window_title);
+            return Some((window_title, hwnd));
+        }
+        if window_title.to_lowercase().contains(app_name_lower) {
+            debug!("Found new window matching app name: '{}'", window_title);
+            return Some((window_title, hwnd));
+        }
+    }
+    None
+}
+
+// Launch or activate an application based on its path and XPath. With skip_verify a
+// window remembered for the application is activated without looking at the XPath.
+fn launch_or_activate(app_path: &str, xpath: &str, skip_verify: bool) -> LaunchOutcome {
     info!("Attempting to launch or activate application: {}", app_path);
     debug!("Using xpath: {}", xpath);
 
+    // Fast path: the window activated by a previous call for this application is still there
+    if let Some(hwnd) = get_cached_app_window(app_path) {
+        if skip_verify || window_matches_xpath(hwnd, xpath) {
+            info!("Activating cached window for application: {}", app_path);
+            return activation_outcome(activate_window(hwnd, app_path), hwnd);
+        }
+        debug!("Cached window for '{}' does not match the XPath anymore", app_path);
+    }
+
     // Extract application name from path
     let app_name = match std::path::Path::new(app_path).file_name() {
         Some(name) => name.to_string_lossy().to_string(),
         None => {
             error!("Invalid application path: {}", app_path);
-            return false;
+            return LaunchOutcome::Failed;
         }
     };
     
@@ -254,12 +659,13 @@ pub fn launch_or_activate_application(app_path: &str, xpath: &str) -> bool {
     debug!("Base name without extension: {}", app_name_without_ext);
     
     // First, try window names from XPath
-    let xpath_window_names = extract_window_names_from_xpath(xpath);
+    let compiled_xpath = compile_xpath(xpath);
+    let xpath_window_names = compiled_xpath.window_names();
     debug!("Extracted {} window names from XPath: {:?}", 
            xpath_window_names.len(), xpath_window_names);
     
     // Build a list of potential window names to check
-    let mut potential_names = xpath_window_names.clone();
+    let mut potential_names = xpath_window_names.to_vec();
     
     // Add app name variations
     potential_names.push(app_name.clone());
@@ -271,7 +677,7 @@ pub fn launch_or_activate_application(app_path: &str, xpath: &str) -> bool {
     debug!("Built {} potential window names to check", potential_names.len());
     trace!("Potential names: {:?}", potential_names);
     
-    // Get all windows on the system - using revised code
+    // Take a single snapshot of all windows; every match pass below works on it
     let all_windows = scan_for_all_windows();
     info!("Found {} windows currently open on the system", all_windows.len());
     trace!("All windows: {:?}", all_windows);
@@ -284,13 +690,13 @@ pub fn launch_or_activate_application(app_path: &str, xpath: &str) -> bool {
         for potential_name in &potential_names {
             if window_title == potential_name {
                 info!("Found exact match for window: '{}'", window_title);
-                let result = activate_window_by_name(window_title);
+                let result = activate_and_remember_window(app_path, window_info.1, window_title);
                 if result {
                     info!("Successfully activated existing window: '{}'", window_title);
                 } else {
                     error!("Failed to activate window: '{}'", window_title);
                 }
-                return result;
+                return activation_outcome(result, window_info.1);
             }
         }
     }
@@ -298,138 +704,169 @@ pub fn launch_or_activate_application(app_path: &str, xpath: &str) -> bool {
     
     // Then try partial/contained matches
     debug!("Attempting partial/contained window title matches");
-    for window_info in &all_windows {
-        let window_title = &window_info.0;
-        
-        for potential_name in &potential_names {
+
+    // Lowercase the candidate names once, kept in parallel with the original names for
+    // logging, so the pass below only lowercases each window title once
+    let (partial_names, partial_names_lower): (Vec<&str>, Vec<String>) = potential_names.iter()
+        .filter(|potential_name| {
             // Skip very short names to avoid false matches
-            if potential_name.len() <= 3 {
+            let keep = potential_name.len() > 3;
+            if !keep {
                 trace!("Skipping short potential name: '{}'", potential_name);
-                continue;
             }
-            
-            if window_title.to_lowercase().contains(&potential_name.to_lowercase()) {
+            keep
+        })
+        .map(|potential_name| (potential_name.as_str(), potential_name.to_lowercase()))
+        .unzip();
+
+    for window_info in &all_windows {
+        let window_title = &window_info.0;
+        let window_title_lower = window_title.to_lowercase();
+        
+        for (potential_name, potential_name_lower) in partial_names.iter().zip(&partial_names_lower) {
+            if window_title_lower.contains(potential_name_lower.as_str()) {
                 info!("Found partial match: '{}' contains '{}'", window_title, potential_name);
-                let result = activate_window_by_name(window_title);
+                let result = activate_and_remember_window(app_path, window_info.1, window_title);
                 if result {
                     info!("Successfully activated existing window: '{}'", window_title);
                 } else {
                     error!("Failed to activate window: '{}'", window_title);
                 }
-                return result;
+                return activation_outcome(result, window_info.1);
             }
         }
     }
     debug!("No partial window title matches found");
 
-    // Try with partial name matching as a fallback
-    debug!("Attempting fallback partial name matching");
-    for name in &potential_names {
-        if name.len() > 3 {
-            trace!("Searching for partial name: '{}'", name);
-            if let Some(found_window) = find_window_with_partial_name(name) {
-                info!("Found window via partial name search: '{}'", found_window);
-                let result = activate_window_by_name(&found_window);
-                if result {
-                    info!("Successfully activated existing window: '{}'", found_window);
-                } else {
-                    error!("Failed to activate window: '{}'", found_window);
-                }
-                return result;
-            }
-        }
-    }
-    debug!("No windows found via partial name matching");
-    
-    // If not found, launch the application
+    // If not found, launch the application. The hook is installed first so that no
+    // window event between spawning and waiting is missed.
+    let mut window_hook = install_window_event_hook();
+
     info!("Window not found, launching new application instance: {}", app_path);
-    match Command::new(app_path).spawn() {
+    let outcome = match Command::new(app_path).spawn() {
         Ok(child) => {
             info!("Successfully spawned process with PID: {:?}", child.id());
             
-            // Wait for ANY window to appear
-            let max_attempts = 20;
-            debug!("Waiting for application window to appear (max {} attempts)", max_attempts);
-            
-            for attempt in 1..=max_attempts {
-                // Progressive wait times
-                let wait_ms = if attempt < 5 {
-                    200
-                } else if attempt < 10 {
-                    500
-                } else {
-                    1000
-                };
-                
-                trace!("Attempt {}/{}: waiting {}ms", attempt, max_attempts, wait_ms);
-                thread::sleep(Duration::from_millis(wait_ms));
-                
-                // Get updated window list
-                let new_windows = scan_for_all_windows();
-                trace!("Found {} windows after waiting", new_windows.len());
-                
-                // Look for windows that match our criteria
-                for window_info in &new_windows {
-                    let window_title = &window_info.0;
-                    
-                    // First check XPath window names
-                    for xpath_name in &xpath_window_names {
-                        if window_title.contains(xpath_name) {
-                            info!("Found new window matching XPath name: '{}' (attempt {})", 
-                                 window_title, attempt);
-                            let result = activate_window_by_name(window_title);
-                            if result {
-                                info!("Successfully activated new window: '{}'", window_title);
-                            } else {
-                                error!("Failed to activate new window: '{}'", window_title);
-                            }
-                            return result;
-                        }
-                    }
-                    
-                    // Then check app name
-                    if window_title.to_lowercase().contains(&app_name_without_ext.to_lowercase()) {
-                        info!("Found new window matching app name: '{}' (attempt {})", 
-                             window_title, attempt);
-                        let result = activate_window_by_name(window_title);
-                        if result {
-                            info!("Successfully activated new window: '{}'", window_title);
-                        } else {
-                            error!("Failed to activate new window: '{}'", window_title);
-                        }
-                        return result;
-                    }
-                }
-                
-                // Try with partial name matching again
-                if let Some(found_window) = find_window_with_partial_name(&app_name_without_ext) {
-                    info!("Found new window via partial name: '{}' (attempt {})", 
-                         found_window, attempt);
-                    let result = activate_window_by_name(&found_window);
+            // Wait for a matching window to appear, rescanning whenever a window is shown
+            // or brought to the foreground instead of polling on a fixed schedule
+            debug!("Waiting for application window to appear (max {:?})", LAUNCH_WINDOW_TIMEOUT);
+            let deadline = Instant::now() + LAUNCH_WINDOW_TIMEOUT;
+            let app_name_lower = app_name_without_ext.to_lowercase();
+
+            loop {
+                if let Some((window_title, hwnd)) = find_launched_window(xpath_window_names, &app_name_lower) {
+                    info!("Found new window: '{}'", window_title);
+                    let result = activate_and_remember_window(app_path, hwnd, &window_title);
                     if result {
-                        info!("Successfully activated new window: '{}'", found_window);
+                        info!("Successfully activated new window: '{}'", window_title);
                     } else {
-                        error!("Failed to activate new window: '{}'", found_window);
+                        error!("Failed to activate new window: '{}'", window_title);
                     }
-                    return result;
+                    break activation_outcome(result, hwnd);
                 }
-                
-                if attempt == 5 {
-                    debug!("Window not found after 5 attempts, increasing wait time");
-                } else if attempt == 10 {
-                    warn!("Window not found after 10 attempts, still trying...");
-                } else if attempt == 15 {
-                    warn!("Window not found after 15 attempts, application may be slow to start");
+
+                let remaining = deadline.saturating_duration_since(Instant::now());
+                if remaining.is_zero() {
+                    // If we still can't find it, assume success anyway
+                    warn!("Could not find window within {:?}, assuming success", LAUNCH_WINDOW_TIMEOUT);
+                    break LaunchOutcome::Started(child.id());
+                }
+
+                match &window_hook {
+                    Some((_, rx)) => match rx.recv_timeout(remaining) {
+                        Ok(()) => {
+                            // Collapse a burst of events into a single rescan
+                            while rx.try_recv().is_ok() {}
+                            trace!("Window event received, rescanning windows");
+                        }
+                        Err(RecvTimeoutError::Timeout) => {}
+                        Err(RecvTimeoutError::Disconnected) => {
+                            warn!("Window event hook disconnected, falling back to polling");
+                            window_hook = None;
+                        }
+                    },
+                    None => thread::sleep(remaining.min(LAUNCH_POLL_INTERVAL)),
                 }
             }
-            
-            // If we still can't find it, assume success anyway
-            warn!("Could not find window after {} attempts, assuming success", max_attempts);
-            true
         },
         Err(e) => {
             error!("Failed to spawn application process: {} - Error: {:?}", app_path, e);
-            false
+            LaunchOutcome::Failed
+        }
+    };
+
+    if let Some((mut hook, _)) = window_hook {
+        if let Err(e) = hook.uninstall() {
+            warn!("Failed to uninstall window event hook: {:?}", e);
         }
     }
-}
\ No newline at end of file
+
+    outcome
+}
+
+
+/// Launch or activate an application based on its path and XPath
+/// Returns true if successful, false otherwise
+/// If skip_verify is set, a window remembered for the application is activated without
+/// checking it against the XPath
+pub fn launch_or_activate_application(app_path: &str, xpath: &str, skip_verify: bool) -> bool {
+    !matches!(launch_or_activate(app_path, xpath, skip_verify), LaunchOutcome::Failed)
+}
+
+/// Launch or activate an application based on its path and XPath
+/// Returns the handle of the activated window, the id of a started process whose
+/// window did not show up in time, or Failed
+pub fn launch_application(app_path: &str, xpath: &str) -> LaunchOutcome {
+    launch_or_activate(app_path, xpath, false)
+}
+
+/// Activate an application window by its handle, e.g. as returned by launch_application
+/// Returns true if the window exists and was activated, false otherwise
+pub fn activate_application(handle: isize) -> bool {
+    debug!("Activate application window with handle: {}", handle);
+
+    let hwnd = handle as HWND;
+    let Some(pid) = get_window_process_id(hwnd) else {
+        error!("Invalid window handle for activation: {}", handle);
+        return false;
+    };
+
+    // Switching directly is enough in most cases; the full activation sequence is
+    // only used if the window did not come to the foreground
+    unsafe {
+        AllowSetForegroundWindow(pid);
+        SwitchToThisWindow(hwnd, 1);
+    }
+    if wait_for_foreground(|foreground_hwnd| foreground_hwnd == hwnd, FOCUS_CONFIRM_TIMEOUT) {
+        info!("Successfully brought window to foreground: {}", handle);
+        return true;
+    }
+    activate_window(hwnd, &handle.to_string())
+}
+
+#[cfg(test)]
+mod tests {
+
+    #[test]
+    fn test_compile_xpath_window_names() {
+        let xpath = r##"/Pane[@ClassName="#32769"][@Name="Desktop 1"]/Window[@ClassName="TeamsWebView"][@Name="Chat | Microsoft Teams"]/Pane[@Name="Teams"]/Window[@Name=""]/Button[@Name="Meet"]"##;
+        let compiled = super::CompiledXPath::new(xpath);
+        assert_eq!(super::parse_xpath_steps(xpath).len(), 5);
+        assert_eq!(compiled.window_names(), ["Chat | Microsoft Teams".to_string()]);
+
+        let xpath = r##"/Window[Name="Calculator"]/Window[@Name="Calculator"][position()=1]/Button[@Name="One"]"##;
+        let compiled = super::CompiledXPath::new(xpath);
+        assert_eq!(compiled.window_names(), ["Calculator".to_string()]);
+
+        let xpath = r##"/Pane[@ClassName=\"#32769\"]/Window[@ClassName=\"TeamsWebView\"][@Name=\"Besprechungen | Microsoft Teams\"]"##;
+        let compiled = super::CompiledXPath::new(xpath);
+        assert_eq!(compiled.window_names(), ["Besprechungen | Microsoft Teams".to_string()]);
+
+        // Single quotes as written by the XPath generator, with a ']' inside a value
+        let xpath = r##"/Pane[@ClassName='#32769']/Window[@Name='Calculator']/Window[@Name='a]b']/Button[@Name='One']"##;
+        assert_eq!(super::parse_xpath_steps(xpath).len(), 4);
+        let compiled = super::CompiledXPath::new(xpath);
+        assert_eq!(compiled.window_names(), ["Calculator".to_string(), "a]b".to_string()]);
+    }
+
+}
@@ -3,7 +3,9 @@ use crate::windriver::Element;
 // use crate::xpath::XpathElement;
 use uitree::UITreeXML;
 use uiautomation::{UIAutomation, UIElement}; // controls::ControlType, 
+use uiautomation::types::{Handle, Point};
 use log::{debug, error, info, warn}; // trace, 
+use std::cell::RefCell;
 
 
 // trait ConvertToControlType {
@@ -66,7 +68,29 @@ use log::{debug, error, info, warn}; // trace,
 //     NotFound,
 // }
 
+thread_local! {
+    // UIAutomation instance of the current thread. Creating one initializes COM and sets
+    // up the connection to the UI Automation core, so it is done once per thread.
+    static UI_AUTOMATION: RefCell<Option<UIAutomation>> = const { RefCell::new(None) };
+}
+
 fn get_ui_automation_instance() -> Option<UIAutomation> {
+    if let Some(uia) = UI_AUTOMATION.with_borrow(|uia| uia.clone()) {
+        return Some(uia);
+    }
+
+    let uia = create_ui_automation_instance()?;
+    UI_AUTOMATION.set(Some(uia.clone()));
+    Some(uia)
+}
+
+/// Create the UIAutomation instance of the current thread ahead of the first element lookup
+/// Returns true if the instance is available
+pub fn prewarm_ui_automation() -> bool {
+    get_ui_automation_instance().is_some()
+}
+
+fn create_ui_automation_instance() -> Option<UIAutomation> {
     debug!("Creating UIAutomation instance");
 
     let uia: UIAutomation;
@@ -296,6 +320,64 @@ impl uiautomation::filters::MatcherFilter for RuntimeIdFilter {
 }
 
 
+// Upper bound for the number of ancestors visited when resolving an element from a point
+const MAX_ANCESTOR_STEPS: usize = 64;
+
+/// Resolve an element bottom-up: hit-test the given point (typically the centre of the
+/// element's last known bounding rectangle) and walk up the parents until the runtime id
+/// matches. This avoids a search over the whole desktop tree for elements that are still
+/// where they were when the UI tree was captured. Returns None if the element is not
+/// found this way, in which case the caller falls back to get_ui_element_by_runtimeid.
+pub fn get_ui_element_by_runtimeid_at_point(runtime_id: &[i32], point: Point) -> Option<UIElement> {
+    debug!("Searching for element with runtime id {:?} from point {:?}", runtime_id, point);
+    let uia = get_ui_automation_instance()?;
+    let walker = uia.get_control_view_walker().ok()?;
+
+    let mut current = uia.element_from_point(point).ok()?;
+    for _ in 0..MAX_ANCESTOR_STEPS {
+        if current.get_runtime_id().map(|id| id == runtime_id).unwrap_or(false) {
+            info!("Element found by runtime id from point: {:?}", current);
+            return Some(current);
+        }
+        match walker.get_parent(&current) {
+            Ok(parent) => current = parent,
+            Err(_) => break,
+        }
+    }
+
+    debug!("Element with runtime id {:?} not found from point", runtime_id);
+    None
+}
+
+/// Resolve an element anchored at its native window handle: the window is looked up
+/// directly and, if it is not the element itself, only its subtree is searched for the
+/// runtime id. Returns None if the handle is not valid or the element is not below it.
+pub fn get_ui_element_by_runtimeid_from_handle(runtime_id: &[i32], handle: isize) -> Option<UIElement> {
+    debug!("Searching for element with runtime id {:?} from handle {}", runtime_id, handle);
+    if handle == 0 {
+        return None;
+    }
+    let uia = get_ui_automation_instance()?;
+    let anchor = uia.element_from_handle(Handle::from(handle)).ok()?;
+
+    if anchor.get_runtime_id().map(|id| id == runtime_id).unwrap_or(false) {
+        info!("Element found by runtime id from handle: {:?}", anchor);
+        return Some(anchor);
+    }
+
+    let matcher = uia.create_matcher().from(anchor).timeout(0).filter(Box::new(RuntimeIdFilter(runtime_id.to_vec()))).depth(99);
+    match matcher.find_first() {
+        Ok(e) => {
+            info!("Element found by runtime id below handle: {:?}", e);
+            Some(e)
+        },
+        Err(_) => {
+            debug!("Element with runtime id {:?} not found below handle {}", runtime_id, handle);
+            None
+        }
+    }
+}
+
 pub fn get_ui_element_by_runtimeid(runtime_id: Vec<i32>) -> Option<UIElement> {
     debug!("Searching for element with runtime id: {:?}", runtime_id);
     // let automation = UIAutomation::new().unwrap();
@@ -1,16 +1,19 @@
 use std::thread;
-use std::sync::Mutex;
-use std::sync::mpsc::{channel, Receiver, Sender};
-use std::time::Duration;
+use std::sync::Once;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::mpsc::{channel, Receiver, RecvTimeoutError, Sender};
+use std::time::{Duration, Instant};
+use std::panic::{catch_unwind, AssertUnwindSafe};
 
+use parking_lot::{Mutex, RwLock};
 use pyo3::prelude::*;
 // use uiautomation::types::Handle;
 
 use crate::sreen_context::ScreenContext;
-use crate::uiauto::{get_ui_element_by_runtimeid}; // get_ui_element_by_xpath, get_element_by_xpath
+use crate::uiauto::{prewarm_ui_automation, get_ui_element_by_runtimeid, get_ui_element_by_runtimeid_at_point, get_ui_element_by_runtimeid_from_handle}; // get_ui_element_by_xpath, get_element_by_xpath
 use uitree::{UITreeXML, get_all_elements_xml};
 // use crate::uiexplore::UITree;
-use crate::app_control::launch_or_activate_application;
+use crate::app_control::{LaunchOutcome, launch_or_activate_application, launch_application, activate_application, wait_for_window_focus, wait_until_window_idle, clear_xpath_cache, clear_app_window_cache};
 
 #[allow(unused_imports)]
 use crate::commons::execute_with_timeout;
@@ -20,13 +23,102 @@ use screen_capture::{Window, Monitor};
 use fs_extra::dir;
 
 use windows::Win32::Foundation::{POINT, RECT}; //HWND, 
-use windows::Win32::UI::WindowsAndMessaging::{GetCursorPos}; //WindowFromPoint
+use windows::Win32::UI::WindowsAndMessaging::{GetPhysicalCursorPos}; //WindowFromPoint
+use windows::Win32::UI::HiDpi::{SetProcessDpiAwarenessContext, DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2};
 
 use uiautomation::{UIElement}; //UIAutomation, 
 
 use log::{debug, error, info, trace, warn};
 
-static WINDRIVER: Mutex<Option<WinDriver>> = Mutex::new(None);
+// Readers (element lookups) share the lock; only installing, refreshing and
+// closing the driver take it exclusively
+static WINDRIVER: RwLock<Option<WinDriver>> = parking_lot::const_rwlock(None);
+
+// Long-lived worker thread collecting the UI tree on request. Each request carries
+// the sender the finished tree is returned on, so no thread is spawned per call.
+// The generation identifies the current worker, so a caller that timed out only
+// replaces the worker it was waiting on.
+static TREE_WORKER: Mutex<Option<(u64, Sender<TreeRequest>)>> = parking_lot::const_mutex(None);
+static TREE_WORKER_GENERATION: AtomicU64 = AtomicU64::new(0);
+
+struct TreeRequest {
+    reply_tx: Sender<UITreeXML>,
+    // the caller stops waiting at this point, so the request is dropped after it
+    deadline: Instant,
+}
+
+fn spawn_tree_worker() -> Sender<TreeRequest> {
+    let (tx, rx): (Sender<TreeRequest>, Receiver<TreeRequest>) = channel();
+    thread::spawn(move || {
+        debug!("UI tree worker thread started");
+        while let Ok(first) = rx.recv() {
+            // Answer every request queued up to now from a single walk, and skip
+            // the ones whose caller has already given up
+            let now = Instant::now();
+            let waiting: Vec<Sender<UITreeXML>> = std::iter::once(first)
+                .chain(rx.try_iter())
+                .filter(|request| request.deadline > now)
+                .map(|request| request.reply_tx)
+                .collect();
+            if waiting.is_empty() {
+                debug!("UI tree worker skipped requests that already timed out");
+                continue;
+            }
+
+            let (tree_tx, tree_rx): (Sender<UITreeXML>, Receiver<UITreeXML>) = channel();
+            // A panic while walking the tree drops tree_tx and then the waiting
+            // senders, which wakes up the callers with an error; the worker stays available
+            if catch_unwind(AssertUnwindSafe(|| get_all_elements_xml(tree_tx, None, None))).is_err() {
+                error!("UI tree worker failed to collect the UI tree");
+                continue;
+            }
+            let Ok(ui_tree) = tree_rx.recv() else {
+                error!("UI tree worker did not receive a UI tree");
+                continue;
+            };
+            debug!("UI tree worker answering {} request(s)", waiting.len());
+            for reply_tx in waiting {
+                // the caller may have timed out in the meantime, nothing to do then
+                let _ = reply_tx.send(ui_tree.clone());
+            }
+        }
+        debug!("UI tree worker thread stopped");
+    });
+    info!("Spawned UI tree worker thread");
+    tx
+}
+
+fn tree_worker() -> (u64, Sender<TreeRequest>) {
+    let mut worker = TREE_WORKER.lock();
+    worker
+        .get_or_insert_with(|| {
+            let generation = TREE_WORKER_GENERATION.fetch_add(1, Ordering::Relaxed);
+            (generation, spawn_tree_worker())
+        })
+        .clone()
+}
+
+/// Ask the UI tree worker for a fresh UI tree and wait at most `timeout` for it
+fn request_ui_tree(timeout: Duration) -> Result<UITreeXML, RecvTimeoutError> {
+    let (tx, rx): (Sender<UITreeXML>, Receiver<UITreeXML>) = channel();
+    let (generation, worker) = tree_worker();
+    let deadline = Instant::now() + timeout;
+    if worker.send(TreeRequest { reply_tx: tx, deadline }).is_err() {
+        error!("UI tree worker is not available");
+        return Err(RecvTimeoutError::Disconnected);
+    }
+    let result = rx.recv_timeout(timeout);
+    if result.is_err() {
+        // The worker is stuck in a walk (or died). Hand later requests to a fresh
+        // worker; the old one exits once its current walk returns and its queue is empty.
+        let mut current = TREE_WORKER.lock();
+        if matches!(current.as_ref(), Some((current_generation, _)) if *current_generation == generation) {
+            warn!("Replacing unresponsive UI tree worker");
+            *current = None;
+        }
+    }
+    result
+}
 
 
 #[pyclass]
@@ -60,172 +152,190 @@ impl Element {
         PyResult::Ok(format!("<Element\nname='{}'\nhandle = {}\nruntime_id = {:?}\nbounding_rectangle = {:?}>", self.name, self.handle, self.runtime_id, self.bounding_rectangle))
     }
 
-    pub fn __str__(&self) -> PyResult<String> {
-        PyResult::Ok(self.name.clone())
+    // Element is a snapshot of the UI tree, so str() and the accessors hand out
+    // borrowed views of the stored values instead of cloning them on every call
+    pub fn __str__(&self) -> &str {
+        &self.name
     }
 
-    pub fn get_name(&self) -> String {
-        self.name.clone()
+    pub fn get_name(&self) -> &str {
+        &self.name
     }
 
-    pub fn get_xpath(&self) -> String {
-        self.xpath.clone()
+    pub fn get_xpath(&self) -> &str {
+        &self.xpath
     }
 
     pub fn get_handle(&self) -> isize {
         self.handle
     }
 
-    pub fn get_runtime_id(&self) -> Vec<i32> {
-        self.runtime_id.clone()
+    pub fn get_runtime_id(&self) -> &[i32] {
+        &self.runtime_id
     }
     
     // Region mouse methods
-    pub fn send_click(&self) -> PyResult<()> {
+    pub fn send_click(&self, py: Python<'_>) -> PyResult<()> {
         debug!("Element::send_click called for element: {}", self.name);
-        if let Ok(e) = convert_to_ui_element(self) {
-            match e.click() {
-                Ok(_) => {
-                    info!("Successfully clicked on element: {:#?}", e);
-                }
-                Err(e) => {
-                    error!("Error clicking on element: {:?}", e);
-                    return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Click failed"));
-                }
+        py.allow_threads(|| {
+            if let Ok(e) = convert_to_ui_element(self) {
+                match e.click() {
+                    Ok(_) => {
+                        info!("Successfully clicked on element: {:#?}", e);
+                    }
+                    Err(e) => {
+                        error!("Error clicking on element: {:?}", e);
+                        return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Click failed"));
+                    }
                 
+                }
+            } else {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
             }
-        } else {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
-        PyResult::Ok(())
+            PyResult::Ok(())
+        })
     }
 
-    pub fn send_double_click(&self) -> PyResult<()> {
+    pub fn send_double_click(&self, py: Python<'_>) -> PyResult<()> {
         debug!("Element::send_double_click called for element: {}", self.name);
-        if let Ok(e) = convert_to_ui_element(self) {
-            match e.double_click() {
-                Ok(_) => {
-                    info!("Double clicked on element: {:#?}", e);
-                }
-                Err(e) => {
-                    error!("Error double clicking on element: {:?}", e);
-                    return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Double click failed"));
+        py.allow_threads(|| {
+            if let Ok(e) = convert_to_ui_element(self) {
+                match e.double_click() {
+                    Ok(_) => {
+                        info!("Double clicked on element: {:#?}", e);
+                    }
+                    Err(e) => {
+                        error!("Error double clicking on element: {:?}", e);
+                        return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Double click failed"));
+                    }
                 }
+            } else {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
             }
-        } else {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
-        PyResult::Ok(())
+            PyResult::Ok(())
+        })
     }
 
-    pub fn send_right_click(&self) -> PyResult<()> {
+    pub fn send_right_click(&self, py: Python<'_>) -> PyResult<()> {
         debug!("Element::send_right_click called for element: {}", self.name);
-        if let Ok(e) = convert_to_ui_element(self) {
-            match e.right_click() {
-                Ok(_) => {
-                    info!("Right clicked on element: {:#?}", e);
-                }
-                Err(e) => {
-                    error!("Error right clicking on element: {:?}", e);
-                    return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Right click failed"));
+        py.allow_threads(|| {
+            if let Ok(e) = convert_to_ui_element(self) {
+                match e.right_click() {
+                    Ok(_) => {
+                        info!("Right clicked on element: {:#?}", e);
+                    }
+                    Err(e) => {
+                        error!("Error right clicking on element: {:?}", e);
+                        return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Right click failed"));
+                    }
                 }
+            } else {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
             }
-        } else {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
-        PyResult::Ok(())
+            PyResult::Ok(())
+        })
     }
 
-    pub fn hold_click(&self, holdkeys: String) -> PyResult<()> {
+    pub fn hold_click(&self, py: Python<'_>, holdkeys: String) -> PyResult<()> {
         debug!("Element::hold_click called for element: {}", self.name);
-        if let Ok(e) = convert_to_ui_element(self) {
-            match e.hold_click(&holdkeys) {
-                Ok(_) => {
-                    info!("Hold clicked on element: {:#?}", e);
-                }
-                Err(e) => {
-                    error!("Error hold clicking on element: {:?}", e);
-                    return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Hold click failed"));
+        py.allow_threads(|| {
+            if let Ok(e) = convert_to_ui_element(self) {
+                match e.hold_click(&holdkeys) {
+                    Ok(_) => {
+                        info!("Hold clicked on element: {:#?}", e);
+                    }
+                    Err(e) => {
+                        error!("Error hold clicking on element: {:?}", e);
+                        return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Hold click failed"));
+                    }
                 }
+            } else {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
             }
-        } else {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
-        PyResult::Ok(())
+            PyResult::Ok(())
+        })
     }
 
     // Region keyboard methods
-    pub fn send_keys(&self, keys: String) -> PyResult<()> {
+    pub fn send_keys(&self, py: Python<'_>, keys: String) -> PyResult<()> {
         debug!("Element::send_keys called with keys: '{}' for element: {}", keys, self.name);
-        if let Ok(e) = convert_to_ui_element(self) {
-            match e.send_keys(&keys, 20) { // 20 ms interval for sending keys
-                Ok(_) => {
-                    info!("Sent keys '{}' to element: {:#?}", keys, e);
-                }
-                Err(e) => {
-                    error!("Error sending keys to element: {:?}", e);
-                    return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Send keys failed"));
+        py.allow_threads(|| {
+            if let Ok(e) = convert_to_ui_element(self) {
+                match e.send_keys(&keys, 20) { // 20 ms interval for sending keys
+                    Ok(_) => {
+                        info!("Sent keys '{}' to element: {:#?}", keys, e);
+                    }
+                    Err(e) => {
+                        error!("Error sending keys to element: {:?}", e);
+                        return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Send keys failed"));
+                    }
                 }
+            } else {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
             }
-        } else {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
-        PyResult::Ok(())
-    }    
+            PyResult::Ok(())
+        })
+    }
 
-    pub fn send_text(&self, text: String) -> PyResult<()> {
+    pub fn send_text(&self, py: Python<'_>, text: String) -> PyResult<()> {
         debug!("Element::send_text called with text: '{}' for element: {}", text, self.name);
-        if let Ok(e) = convert_to_ui_element(self) {
-            match e.send_text(&text, 20) { // 20 ms interval for sending text
-                Ok(_) => {
-                    info!("Sent text '{}' to element: {:#?}", text, e);
-                }
-                Err(e) => {
-                    error!("Error sending text to element: {:?}", e);
-                    return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Send text failed"));
+        py.allow_threads(|| {
+            if let Ok(e) = convert_to_ui_element(self) {
+                match e.send_text(&text, 20) { // 20 ms interval for sending text
+                    Ok(_) => {
+                        info!("Sent text '{}' to element: {:#?}", text, e);
+                    }
+                    Err(e) => {
+                        error!("Error sending text to element: {:?}", e);
+                        return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Send text failed"));
+                    }
                 }
+            } else {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
             }
-        } else {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
-        PyResult::Ok(())
+            PyResult::Ok(())
+        })
     }
 
-    pub fn hold_send_keys(&self, holdkeys: String, keys: String, interval: u64) -> PyResult<()> {
+    pub fn hold_send_keys(&self, py: Python<'_>, holdkeys: String, keys: String, interval: u64) -> PyResult<()> {
         debug!("Element::hold_send_keys called with keys: '{}' for element: {}", keys, self.name);
-        if let Ok(e) = convert_to_ui_element(self) {
-            match e.hold_send_keys(&holdkeys, &keys, interval) { // hold for the specified duration
-                Ok(_) => {
-                    info!("Hold sent keys '{}' to element: {:#?}", keys, e);
-                }
-                Err(e) => {
-                    error!("Error holding send keys to element: {:?}", e);
-                    return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Hold send keys failed"));
+        py.allow_threads(|| {
+            if let Ok(e) = convert_to_ui_element(self) {
+                match e.hold_send_keys(&holdkeys, &keys, interval) { // hold for the specified duration
+                    Ok(_) => {
+                        info!("Hold sent keys '{}' to element: {:#?}", keys, e);
+                    }
+                    Err(e) => {
+                        error!("Error holding send keys to element: {:?}", e);
+                        return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Hold send keys failed"));
+                    }
                 }
+            } else {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
             }
-        } else {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
-        PyResult::Ok(())
+            PyResult::Ok(())
+        })
     }
 
     // Region misc methods
-    pub fn show_context_menu(&self) -> PyResult<()> {
+    pub fn show_context_menu(&self, py: Python<'_>) -> PyResult<()> {
         debug!("Element::show_context_menu called for element: {}", self.name);
-        if let Ok(e) = convert_to_ui_element(self) {
-            match e.show_context_menu() {
-                Ok(_) => {
-                    info!("Context menu shown for element: {:#?}", e);
-                }
-                Err(e) => {
-                    error!("Error showing context menu for element: {:?}", e);
-                    return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Show context menu failed"));
+        py.allow_threads(|| {
+            if let Ok(e) = convert_to_ui_element(self) {
+                match e.show_context_menu() {
+                    Ok(_) => {
+                        info!("Context menu shown for element: {:#?}", e);
+                    }
+                    Err(e) => {
+                        error!("Error showing context menu for element: {:?}", e);
+                        return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Show context menu failed"));
+                    }
                 }
+            } else {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
             }
-        } else {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
-        PyResult::Ok(())
+            PyResult::Ok(())
+        })
     }
 
 }
@@ -250,9 +360,28 @@ impl Default for Element {
 fn convert_to_ui_element(element: &Element) -> Result<UIElement, uiautomation::Error> {
     debug!("Element::convert_to_ui_element called.");
 
-    // First attempt: try to get the element by runtime id
-    if let Some(ui_element) = get_ui_element_by_runtimeid(element.get_runtime_id()) {
-        debug!("Element found by runtime id on first attempt.");
+    // First attempt: resolve the element anchored at its native window handle.
+    // For a stale element all three attempts below miss, so before auto-refresh starts
+    // it costs a subtree search of its window, a walk at its last position and a
+    // search of the whole desktop.
+    if let Some(ui_element) = get_ui_element_by_runtimeid_from_handle(element.get_runtime_id(), element.get_handle()) {
+        debug!("Element found by runtime id from its window handle.");
+        return Ok(ui_element);
+    }
+
+    // Next attempt: resolve the element bottom-up from its last known position
+    let rect = &element.bounding_rectangle;
+    if rect.right > rect.left && rect.bottom > rect.top {
+        let center = uiautomation::types::Point::new((rect.left + rect.right) / 2, (rect.top + rect.bottom) / 2);
+        if let Some(ui_element) = get_ui_element_by_runtimeid_at_point(element.get_runtime_id(), center) {
+            debug!("Element found by runtime id at its last known position.");
+            return Ok(ui_element);
+        }
+    }
+
+    // Last attempt: search the whole tree for the runtime id
+    if let Some(ui_element) = get_ui_element_by_runtimeid(element.get_runtime_id().to_vec()) {
+        debug!("Element found by runtime id in a search of the whole tree.");
         return Ok(ui_element);
     }
 
@@ -261,13 +390,7 @@ fn convert_to_ui_element(element: &Element) -> Result<UIElement, uiautomation::E
 
     // Check if auto-refresh is enabled
     let auto_refresh_enabled = {
-        let driver_guard = match WINDRIVER.lock() {
-            Ok(guard) => guard,
-            Err(poisoned) => {
-                error!("WINDRIVER lock is poisoned, recovering...");
-                poisoned.into_inner()
-            }
-        };
+        let driver_guard = WINDRIVER.read();
         driver_guard.as_ref().map(|d| d.auto_refresh_on_stale).unwrap_or(false)
     };
 
@@ -282,14 +405,9 @@ fn convert_to_ui_element(element: &Element) -> Result<UIElement, uiautomation::E
     info!("Auto-refresh enabled. Attempting to refresh UI tree and retry...");
 
     // FIX BUG #3 & #4: Start refresh outside the lock, use timeout on recv()
-    let (tx, rx): (Sender<_>, Receiver<UITreeXML>) = channel();
-    thread::spawn(|| {
-        debug!("Spawning thread to refresh UI tree for stale element recovery");
-        get_all_elements_xml(tx, None, None);
-    });
-
     // Wait for UI tree with timeout (10 seconds)
-    let new_tree = match rx.recv_timeout(Duration::from_secs(10)) {
+    debug!("Requesting UI tree refresh for stale element recovery");
+    let new_tree = match request_ui_tree(Duration::from_secs(10)) {
         Ok(tree) => {
             info!("UI tree refreshed successfully for stale element recovery");
             tree
@@ -303,54 +421,46 @@ fn convert_to_ui_element(element: &Element) -> Result<UIElement, uiautomation::E
         }
     };
 
-    // FIX BUG #5: Handle lock errors properly
-    // Update the global WinDriver with the new tree
-    let mut driver_guard = match WINDRIVER.lock() {
-        Ok(guard) => guard,
-        Err(poisoned) => {
-            error!("WINDRIVER lock is poisoned during refresh, recovering...");
-            poisoned.into_inner()
-        }
-    };
+    // Update the global WinDriver with the new tree. The guard is confined to this
+    // block, so it is released before any further blocking UIA call below.
+    {
+        let mut driver_guard = WINDRIVER.write();
 
-    if let Some(driver) = driver_guard.as_mut() {
-        driver.ui_tree = new_tree;
-        driver.tree_needs_update = false;
-    } else {
-        error!("WinDriver instance not found in global state");
-        drop(driver_guard);
-        return Err(uiautomation::Error::new(
-            uiautomation::errors::ERR_NOTFOUND,
-            "WinDriver instance not available for refresh"
-        ));
+        if let Some(driver) = driver_guard.as_mut() {
+            driver.ui_tree = new_tree;
+            driver.tree_needs_update = false;
+        } else {
+            error!("WinDriver instance not found in global state");
+            return Err(uiautomation::Error::new(
+                uiautomation::errors::ERR_NOTFOUND,
+                "WinDriver instance not available for refresh"
+            ));
+        }
     }
-    drop(driver_guard);
 
     // FIX BUG #2: Try to recover element by XPath instead of runtime_id
     // This handles the case where UI was recreated with new runtime IDs
     info!("Attempting to find element by XPath after refresh: {}", element.get_xpath());
 
-    let driver_guard = match WINDRIVER.lock() {
-        Ok(guard) => guard,
-        Err(poisoned) => poisoned.into_inner()
-    };
+    // Only the runtime id leaves the read guard's scope
+    let new_runtime_id = {
+        let driver_guard = WINDRIVER.read();
 
-    if let Some(driver) = driver_guard.as_ref() {
-        if let Some(refreshed_elem) = driver.ui_tree.get_element_by_xpath(element.get_xpath().as_str()) {
-            // Found element by XPath! Get the new runtime_id and find the UIElement
-            let new_runtime_id = refreshed_elem.get_runtime_id().clone();
-            drop(driver_guard);
+        driver_guard.as_ref()
+            .and_then(|driver| driver.ui_tree.get_element_by_xpath(element.get_xpath()))
+            .map(|refreshed_elem| refreshed_elem.get_runtime_id().clone())
+    };
 
-            if let Some(ui_element) = get_ui_element_by_runtimeid(new_runtime_id) {
-                info!("Element found by XPath after UI tree refresh (runtime_id may have changed).");
-                return Ok(ui_element);
-            }
+    if let Some(new_runtime_id) = new_runtime_id {
+        // Found element by XPath! Find the UIElement by its new runtime_id
+        if let Some(ui_element) = get_ui_element_by_runtimeid(new_runtime_id) {
+            info!("Element found by XPath after UI tree refresh (runtime_id may have changed).");
+            return Ok(ui_element);
         }
     }
-    drop(driver_guard);
 
     // Fallback: try the old runtime_id in case it's still valid
-    if let Some(ui_element) = get_ui_element_by_runtimeid(element.get_runtime_id()) {
+    if let Some(ui_element) = get_ui_element_by_runtimeid(element.get_runtime_id().to_vec()) {
         info!("Element found by runtime id after UI tree refresh.");
         return Ok(ui_element);
     }
@@ -382,13 +492,7 @@ impl WinDriver {
 
         // FIX BUG #6: Enforce single instance pattern
         // Check if a WinDriver instance already exists
-        let existing_driver = match WINDRIVER.lock() {
-            Ok(guard) => guard.is_some(),
-            Err(poisoned) => {
-                warn!("WINDRIVER lock is poisoned during instance check, recovering...");
-                poisoned.into_inner().is_some()
-            }
-        };
+        let existing_driver = WINDRIVER.read().is_some();
 
         if existing_driver {
             error!("Attempted to create multiple WinDriver instances");
@@ -399,16 +503,18 @@ impl WinDriver {
             ));
         }
 
-        // get the ui tree in a separate thread
-        let (tx, rx): (Sender<_>, Receiver<UITreeXML>) = channel();
-        thread::spawn(|| {
-            debug!("Spawning thread to get UI tree");
-            get_all_elements_xml(tx, None, None);
-        });
-        info!("Spawned separate thread to get ui tree");
+        ensure_dpi_awareness();
+
+        // Set up UI Automation for this thread now rather than on the first element lookup
+        if !prewarm_ui_automation() {
+            warn!("UIAutomation could not be initialized, element lookups may fail");
+        }
+
+        // get the ui tree from the tree worker thread
+        debug!("Requesting initial UI tree");
 
         // FIX BUG #4: Add timeout to recv()
-        let ui_tree: UITreeXML = match rx.recv_timeout(Duration::from_secs(30)) {
+        let ui_tree: UITreeXML = match request_ui_tree(Duration::from_secs(30)) {
             Ok(tree) => {
                 debug!("UI tree received with {} elements", tree.get_elements().len());
                 tree
@@ -428,17 +534,9 @@ impl WinDriver {
             auto_refresh_on_stale: true, // Enable auto-refresh by default
         };
 
-        // FIX BUG #5: Handle lock errors properly
-        match WINDRIVER.lock() {
-            Ok(mut guard) => {
-                *guard = Some(driver.clone());
-            }
-            Err(poisoned) => {
-                error!("WINDRIVER lock is poisoned, recovering...");
-                let mut guard = poisoned.into_inner();
-                *guard = Some(driver.clone());
-            }
-        }
+        let global_driver = driver.clone();
+
+        *WINDRIVER.write() = Some(global_driver);
 
         info!("WinDriver successfully created with auto-refresh enabled (singleton instance)");
         Ok(driver)
@@ -482,104 +580,133 @@ impl WinDriver {
     ///     enabled (bool): True to enable auto-refresh, False to disable
     pub fn set_auto_refresh(&mut self, enabled: bool) {
         self.auto_refresh_on_stale = enabled;
-        // FIX BUG #5: Update the global instance with proper error handling
-        match WINDRIVER.lock() {
-            Ok(mut guard) => {
-                *guard = Some(self.clone());
-            }
-            Err(poisoned) => {
-                error!("WINDRIVER lock is poisoned, recovering...");
-                let mut guard = poisoned.into_inner();
-                *guard = Some(self.clone());
-            }
-        }
+        let updated_driver = self.clone();
+        *WINDRIVER.write() = Some(updated_driver);
         info!("Auto-refresh on stale elements set to: {}", enabled);
     }
 
-    pub fn get_curser_pos(&self) -> PyResult<(i32, i32)> {
+    /// Get the current mouse cursor position in physical screen coordinates
+    ///
+    /// Returns:
+    ///     tuple[int, int]: x and y coordinates of the cursor
+    pub fn get_cursor_pos(&self) -> PyResult<(i32, i32)> {
+        debug!("WinDriver::get_cursor_pos called.");
+        let point = get_physical_cursor_pos();
+        PyResult::Ok((point.x, point.y))
+    }
+
+    /// Deprecated alias of get_cursor_pos
+    pub fn get_curser_pos(&self, py: Python<'_>) -> PyResult<(i32, i32)> {
         debug!("WinDriver::get_curser_pos called.");
-        let mut point = windows::Win32::Foundation::POINT { x: 0, y: 0 };
-        unsafe {
-            let _res= GetCursorPos(&mut point);
-            PyResult::Ok((point.x, point.y))
-        }
+        PyErr::warn(
+            py,
+            py.get_type::<pyo3::exceptions::PyDeprecationWarning>().as_any(),
+            c"get_curser_pos() is deprecated, use get_cursor_pos() instead",
+            1,
+        )?;
+        self.get_cursor_pos()
     }
 
-    pub fn get_ui_element(&self, x: i32, y: i32) -> PyResult<Element> {
+    pub fn get_ui_element(slf: &Bound<'_, Self>, py: Python<'_>, x: i32, y: i32) -> PyResult<Element> {
         debug!("WinDriver::get_ui_element called for coordinates: ({}, {})", x, y);
 
-        let cursor_position = POINT { x, y };
+        let fallback_tree = local_fallback_tree(slf);
+        // The tree lookup only touches native Rust data, so other Python threads may run meanwhile
+        py.allow_threads(|| {
+            let cursor_position = POINT { x, y };
+
+            // FIX BUG #1: Read from global WINDRIVER to get most recent tree
+            let driver_guard = WINDRIVER.read();
+
+            let Some(ui_tree) = current_tree(&driver_guard, fallback_tree.as_ref()) else {
+                return PyResult::Err(pyo3::exceptions::PyRuntimeError::new_err("No UI tree available, the WinDriver was closed"));
+            };
 
-        // FIX BUG #1: Read from global WINDRIVER to get most recent tree
-        let driver_guard = match WINDRIVER.lock() {
-            Ok(guard) => guard,
-            Err(poisoned) => {
-                error!("WINDRIVER lock is poisoned, recovering...");
-                poisoned.into_inner()
+            if let Some(element) = get_element_at_point(ui_tree, &cursor_position) {
+                info!("Successfully found element at ({}, {}): {}", x, y, element.name);
+                return PyResult::Ok(element)
+            } else {
+                warn!("No element found at coordinates ({}, {})", x, y);
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found at the given coordinates"))
             }
-        };
 
-        let ui_tree = if let Some(driver) = driver_guard.as_ref() {
-            &driver.ui_tree
-        } else {
-            warn!("No WinDriver instance in global state, using local tree");
-            &self.ui_tree
-        };
+        })
+    }
 
-        if let Some(ui_element_in_tree) = crate::rectangle::get_point_bounding_rect(&cursor_position, ui_tree.get_elements()) {
-            let xpath = ui_tree.get_xpath_for_element(ui_element_in_tree.get_tree_index(), true);
-            trace!("Found element with xpath: {}", xpath);
-
-            let ui_element_props = ui_element_in_tree.get_element_props();
-            let ui_element_props = ui_element_props.get_element();
-            let bounding_rect = ui_element_props.get_bounding_rectangle();
-            let element = Element::new(
-                ui_element_props.get_name().clone(),
-                xpath,
-                ui_element_props.get_handle(),
-                ui_element_props.get_runtime_id().clone(),
-                (bounding_rect.get_left(), bounding_rect.get_top(), bounding_rect.get_right(), bounding_rect.get_bottom())
-            );
-            info!("Successfully found element at ({}, {}): {}", x, y, element.name);
-            return PyResult::Ok(element)
-        } else {
-            warn!("No element found at coordinates ({}, {})", x, y);
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found at the given coordinates"))
-        }
+    /// Get the UI element under the mouse cursor
+    ///
+    /// Reads the cursor position and resolves the element in one native call,
+    /// replacing get_cursor_pos followed by get_ui_element(x, y).
+    ///
+    /// Returns:
+    ///     Element: The UI element under the mouse cursor
+    pub fn get_ui_element_at_cursor(slf: &Bound<'_, Self>, py: Python<'_>) -> PyResult<Element> {
+        debug!("WinDriver::get_ui_element_at_cursor called.");
+
+        let fallback_tree = local_fallback_tree(slf);
+        py.allow_threads(|| {
+            let (cursor_position, element) = find_element_at_cursor(fallback_tree.as_ref());
+            let (x, y) = (cursor_position.x, cursor_position.y);
+            if let Some(element) = element {
+                info!("Successfully found element under cursor at ({}, {}): {}", x, y, element.name);
+                PyResult::Ok(element)
+            } else {
+                warn!("No element found under cursor at ({}, {})", x, y);
+                PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found at the cursor position"))
+            }
+        })
+    }
 
+    /// Describe the UI element under the mouse cursor in a single call
+    ///
+    /// Reads the cursor position and resolves the element from the UI tree in
+    /// one native call, instead of calling get_cursor_pos, get_ui_element and
+    /// the Element getters one after another.
+    ///
+    /// Returns:
+    ///     tuple[int, int, str, str, int, list[int]]: x, y, name, xpath, handle and runtime id
+    pub fn describe_cursor(slf: &Bound<'_, Self>, py: Python<'_>) -> PyResult<(i32, i32, String, String, isize, Vec<i32>)> {
+        debug!("WinDriver::describe_cursor called.");
+
+        let fallback_tree = local_fallback_tree(slf);
+        py.allow_threads(|| {
+            let (cursor_position, element) = find_element_at_cursor(fallback_tree.as_ref());
+            let (x, y) = (cursor_position.x, cursor_position.y);
+            if let Some(element) = element {
+                info!("Successfully found element under cursor at ({}, {}): {}", x, y, element.name);
+                PyResult::Ok((x, y, element.name, element.xpath, element.handle, element.runtime_id))
+            } else {
+                warn!("No element found under cursor at ({}, {})", x, y);
+                PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found at the cursor position"))
+            }
+        })
     }
 
-    fn get_ui_element_by_xpath(&self, xpath: String) -> PyResult<Element> {
+    fn get_ui_element_by_xpath(slf: &Bound<'_, Self>, py: Python<'_>, xpath: String) -> PyResult<Element> {
         debug!("WinDriver::get_ui_element_by_xpath called.");
 
-        // FIX BUG #1: Read from global WINDRIVER to get most recent tree
-        let driver_guard = match WINDRIVER.lock() {
-            Ok(guard) => guard,
-            Err(poisoned) => {
-                error!("WINDRIVER lock is poisoned, recovering...");
-                poisoned.into_inner()
-            }
-        };
+        let fallback_tree = local_fallback_tree(slf);
+        py.allow_threads(|| {
+            // FIX BUG #1: Read from global WINDRIVER to get most recent tree
+            let driver_guard = WINDRIVER.read();
 
-        let ui_tree = if let Some(driver) = driver_guard.as_ref() {
-            &driver.ui_tree
-        } else {
-            warn!("No WinDriver instance in global state, using local tree");
-            &self.ui_tree
-        };
+            let Some(ui_tree) = current_tree(&driver_guard, fallback_tree.as_ref()) else {
+                return PyResult::Err(pyo3::exceptions::PyRuntimeError::new_err("No UI tree available, the WinDriver was closed"));
+            };
 
-        let ui_elem = ui_tree.get_element_by_xpath(xpath.as_str());
-        if ui_elem.is_none() {
-            return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
-        }
+            let ui_elem = ui_tree.get_element_by_xpath(xpath.as_str());
+            if ui_elem.is_none() {
+                return PyResult::Err(pyo3::exceptions::PyValueError::new_err("Element not found"));
+            }
 
-        let element = ui_elem.unwrap();
-        let name = element.get_name().clone();
-        let xpath = xpath.clone();
-        let handle = element.get_handle();
-        let runtime_id = element.get_runtime_id().clone();
-        let bounding_rectangle = element.get_bounding_rectangle();
-        PyResult::Ok(Element::new(name, xpath, handle, runtime_id, (bounding_rectangle.get_left(), bounding_rectangle.get_top(), bounding_rectangle.get_right(), bounding_rectangle.get_bottom())))
+            let element = ui_elem.unwrap();
+            let name = element.get_name().clone();
+            let xpath = xpath.clone();
+            let handle = element.get_handle();
+            let runtime_id = element.get_runtime_id().clone();
+            let bounding_rectangle = element.get_bounding_rectangle();
+            PyResult::Ok(Element::new(name, xpath, handle, runtime_id, (bounding_rectangle.get_left(), bounding_rectangle.get_top(), bounding_rectangle.get_right(), bounding_rectangle.get_bottom())))
+        })
     }
 
     pub fn get_screen_context(&self) -> PyResult<ScreenContext> {
@@ -648,13 +775,93 @@ impl WinDriver {
     /// Args:
     ///     app_path (str): Full path to the application executable
     ///     xpath (str): XPath that identifies an element in the application window
+    ///     skip_verify (bool): Activate the window found by a previous call for this
+    ///         application without checking it against the XPath (default False)
     /// 
     /// Returns:
     ///     bool: True if the application was successfully launched or activated
-    pub fn launch_or_activate_app(&self, app_path: String, xpath: String) -> PyResult<bool> {
-        debug!("WinDriver::launch_or_activate_app called with {} as app path and {} as xpath element.", app_path, xpath);
+    #[pyo3(signature = (app_path, xpath, skip_verify=false))]
+    pub fn launch_or_activate_app(_slf: &Bound<'_, Self>, py: Python<'_>, app_path: String, xpath: String, skip_verify: bool) -> PyResult<bool> {
+        debug!("WinDriver::launch_or_activate_app called with {} as app path and {} as xpath element (skip_verify={}).", app_path, xpath, skip_verify);
+
+        // Launching can take seconds and only uses native window APIs, so other
+        // Python threads may run meanwhile
+        let result = py.allow_threads(|| launch_or_activate_application(&app_path, &xpath, skip_verify));
+        PyResult::Ok(result)
+    }
+
+    /// Launch or activate an application and return the handle of its window
+    /// 
+    /// Args:
+    ///     app_path (str): Full path to the application executable
+    ///     xpath (str): XPath that identifies an element in the application window
+    /// 
+    /// Returns:
+    ///     int | None: Handle of the activated window, or None if no window was found
+    ///
+    /// Raises:
+    ///     TimeoutError: If the application was started but its window did not appear in time
+    pub fn launch_app(_slf: &Bound<'_, Self>, py: Python<'_>, app_path: String, xpath: String) -> PyResult<Option<isize>> {
+        debug!("WinDriver::launch_app called with {} as app path and {} as xpath element.", app_path, xpath);
+
+        match py.allow_threads(|| launch_application(&app_path, &xpath)) {
+            LaunchOutcome::Activated(handle) => PyResult::Ok(Some(handle)),
+            LaunchOutcome::Started(pid) => {
+                // Not reported as None, a retry would start a second instance
+                PyResult::Err(pyo3::exceptions::PyTimeoutError::new_err(format!(
+                    "Started {} (pid {}), but its window did not appear in time", app_path, pid
+                )))
+            }
+            LaunchOutcome::Failed => PyResult::Ok(None),
+        }
+    }
 
-        let result = launch_or_activate_application(&app_path, &xpath);
+    /// Activate an application window by its handle
+    /// 
+    /// Args:
+    ///     handle (int): Window handle, e.g. as returned by launch_app
+    /// 
+    /// Returns:
+    ///     bool: True if the window exists and was activated
+    pub fn activate_app(_slf: &Bound<'_, Self>, py: Python<'_>, handle: isize) -> PyResult<bool> {
+        debug!("WinDriver::activate_app called with handle {}.", handle);
+
+        let result = py.allow_threads(|| activate_application(handle));
+        PyResult::Ok(result)
+    }
+
+    /// Wait until the application owning a window is in the foreground
+    ///
+    /// Args:
+    ///     handle (int): Window handle, e.g. as returned by launch_app
+    ///     timeout_ms (int): Maximum time to wait in milliseconds
+    ///
+    /// Returns:
+    ///     bool: True if the application got the focus within the timeout
+    pub fn wait_for_focus(_slf: &Bound<'_, Self>, py: Python<'_>, handle: isize, timeout_ms: u64) -> PyResult<bool> {
+        debug!("WinDriver::wait_for_focus called for handle {} with timeout {} ms.", handle, timeout_ms);
+
+        let result = py.allow_threads(|| wait_for_window_focus(handle, Duration::from_millis(timeout_ms)));
+        PyResult::Ok(result)
+    }
+
+    /// Wait until the application owning a window is idle
+    ///
+    /// Returns as soon as the application has processed its pending input and its
+    /// windows did not change for 300 ms (or for the rest of the timeout, if that
+    /// is shorter), instead of sleeping for a fixed time.
+    ///
+    /// Args:
+    ///     handle (int): Window handle, e.g. as returned by launch_app
+    ///     timeout_ms (int): Maximum time to wait in milliseconds (default 3000)
+    ///
+    /// Returns:
+    ///     bool: True if the application became idle within the timeout
+    #[pyo3(signature = (handle, timeout_ms=3000))]
+    pub fn wait_until_idle(_slf: &Bound<'_, Self>, py: Python<'_>, handle: isize, timeout_ms: u64) -> PyResult<bool> {
+        debug!("WinDriver::wait_until_idle called for handle {} with timeout {} ms.", handle, timeout_ms);
+
+        let result = py.allow_threads(|| wait_until_window_idle(handle, Duration::from_millis(timeout_ms)));
         PyResult::Ok(result)
     }
 
@@ -665,40 +872,50 @@ impl WinDriver {
     ///
     /// Returns:
     ///     None
-    pub fn refresh(&mut self) -> PyResult<()> {
+    pub fn refresh(slf: &Bound<'_, Self>) -> PyResult<()> {
         debug!("WinDriver::refresh called.");
-        // get the ui tree in a separate thread
-        let (tx, rx): (Sender<_>, Receiver<UITreeXML>) = channel();
-        thread::spawn(|| {
-            debug!("Spawning thread to get UI tree");
-            get_all_elements_xml(tx, None, None);
-        });
-        info!("Spawned separate thread to refresh ui tree");
-
-        // FIX BUG #4: Add timeout to recv()
-        let ui_tree: UITreeXML = match rx.recv_timeout(Duration::from_secs(30)) {
-            Ok(tree) => tree,
-            Err(e) => {
-                error!("Timeout waiting for UI tree refresh: {:?}", e);
-                return Err(pyo3::exceptions::PyTimeoutError::new_err(
-                    "Timeout waiting for UI tree refresh (30s)"
-                ));
+        // Walk the tree without holding a borrow of the driver, so other
+        // threads can keep using it while the (possibly slow) walk runs
+        let ui_tree: UITreeXML = slf.py().allow_threads(|| {
+            // get the ui tree from the tree worker thread
+            debug!("Requesting UI tree refresh");
+
+            // FIX BUG #4: Add timeout to recv()
+            match request_ui_tree(Duration::from_secs(30)) {
+                Ok(tree) => PyResult::Ok(tree),
+                Err(e) => {
+                    error!("Timeout waiting for UI tree refresh: {:?}", e);
+                    Err(pyo3::exceptions::PyTimeoutError::new_err(
+                        "Timeout waiting for UI tree refresh (30s)"
+                    ))
+                }
             }
+        })?;
+
+        let updated_driver = {
+            let mut this = slf.try_borrow_mut().map_err(|_| {
+                error!("WinDriver is in use by another thread, refreshed UI tree was discarded");
+                pyo3::exceptions::PyRuntimeError::new_err(
+                    "WinDriver is in use by another thread, refresh() could not store the new UI tree"
+                )
+            })?;
+            this.ui_tree = ui_tree;
+            this.tree_needs_update = false;
+            // Clone the (large) driver state before locking, so the write guard
+            // is only held for the pointer swap
+            this.clone()
         };
 
-        self.ui_tree = ui_tree;
-        self.tree_needs_update = false;
-
-        // FIX BUG #5: Handle lock errors properly
-        match WINDRIVER.lock() {
-            Ok(mut guard) => {
-                *guard = Some(self.clone());
-            }
-            Err(poisoned) => {
-                error!("WINDRIVER lock is poisoned, recovering...");
-                let mut guard = poisoned.into_inner();
-                *guard = Some(self.clone());
+        {
+            let mut driver_guard = WINDRIVER.write();
+            // close() may have run while the tree was collected; don't bring the singleton back
+            if driver_guard.is_none() {
+                warn!("WinDriver was closed during refresh, discarding the new UI tree");
+                return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                    "WinDriver was closed while the UI tree was being refreshed"
+                ));
             }
+            *driver_guard = Some(updated_driver);
         }
 
         info!("UI tree refreshed successfully");
@@ -718,21 +935,98 @@ impl WinDriver {
         debug!("WinDriver::close called.");
 
         // Clear the global WINDRIVER instance
-        match WINDRIVER.lock() {
-            Ok(mut guard) => {
-                *guard = None;
-                info!("WinDriver instance closed and global singleton cleared");
-            }
-            Err(poisoned) => {
-                warn!("WINDRIVER lock is poisoned during close, recovering...");
-                let mut guard = poisoned.into_inner();
-                *guard = None;
-                info!("WinDriver instance closed and global singleton cleared (after lock recovery)");
-            }
-        }
+        *WINDRIVER.write() = None;
+        clear_xpath_cache();
+        clear_app_window_cache();
+        info!("WinDriver instance closed and global singleton cleared");
 
         PyResult::Ok(())
     }
+
+    pub fn __enter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    /// Close the driver when leaving a `with` block; exceptions are not suppressed
+    pub fn __exit__(&mut self, _exc_type: &Bound<'_, PyAny>, _exc_value: &Bound<'_, PyAny>, _traceback: &Bound<'_, PyAny>) -> PyResult<bool> {
+        debug!("WinDriver::__exit__ called.");
+        self.close()?;
+        PyResult::Ok(false)
+    }
+}
+
+/// Read the cursor position in physical screen coordinates, the coordinate space of
+/// the bounding rectangles in the UI tree, so no DPI conversion is needed
+fn get_physical_cursor_pos() -> POINT {
+    let mut point = POINT { x: 0, y: 0 };
+    unsafe {
+        let _res = GetPhysicalCursorPos(&mut point);
+    }
+    point
+}
+
+// Make the process per-monitor DPI aware once, so that cursor positions and window
+// coordinates are reported unscaled on every monitor
+fn ensure_dpi_awareness() {
+    static DPI_AWARENESS: Once = Once::new();
+    DPI_AWARENESS.call_once(|| {
+        let res = unsafe { SetProcessDpiAwarenessContext(DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2) };
+        if let Err(e) = res {
+            // Fails if the awareness was already set, e.g. by the application manifest
+            debug!("DPI awareness context not changed: {:?}", e);
+        }
+    });
+}
+
+/// Read the cursor position and look up the element under it in the current UI tree,
+/// using `fallback_tree` if no driver is installed in the global state
+fn find_element_at_cursor(fallback_tree: Option<&UITreeXML>) -> (POINT, Option<Element>) {
+    let cursor_position = get_physical_cursor_pos();
+
+    // FIX BUG #1: Read from global WINDRIVER to get most recent tree
+    let driver_guard = WINDRIVER.read();
+
+    let element = current_tree(&driver_guard, fallback_tree)
+        .and_then(|ui_tree| get_element_at_point(ui_tree, &cursor_position));
+    (cursor_position, element)
+}
+
+/// Copy of the driver's own tree for lookups while no global driver is installed.
+/// Taken while holding the GIL, so that lookups running without it don't keep the
+/// driver borrowed; nothing is copied in the common case of an installed driver.
+fn local_fallback_tree(slf: &Bound<'_, WinDriver>) -> Option<UITreeXML> {
+    if WINDRIVER.read().is_some() {
+        return None;
+    }
+    slf.try_borrow().ok().map(|driver| driver.ui_tree.clone())
+}
+
+/// The tree of the global driver, or the local fallback if there is none
+fn current_tree<'a>(driver: &'a Option<WinDriver>, fallback_tree: Option<&'a UITreeXML>) -> Option<&'a UITreeXML> {
+    match driver {
+        Some(driver) => Some(&driver.ui_tree),
+        None => {
+            warn!("No WinDriver instance in global state, using local tree");
+            fallback_tree
+        }
+    }
+}
+
+fn get_element_at_point(ui_tree: &UITreeXML, point: &POINT) -> Option<Element> {
+    let ui_element_in_tree = crate::rectangle::get_point_bounding_rect(point, ui_tree.get_elements())?;
+    let xpath = ui_tree.get_xpath_for_element(ui_element_in_tree.get_tree_index(), true);
+    trace!("Found element with xpath: {}", xpath);
+
+    let ui_element_props = ui_element_in_tree.get_element_props();
+    let ui_element_props = ui_element_props.get_element();
+    let bounding_rect = ui_element_props.get_bounding_rectangle();
+    Some(Element::new(
+        ui_element_props.get_name().clone(),
+        xpath,
+        ui_element_props.get_handle(),
+        ui_element_props.get_runtime_id().clone(),
+        (bounding_rect.get_left(), bounding_rect.get_top(), bounding_rect.get_right(), bounding_rect.get_bottom())
+    ))
 }
 
 fn normalized(filename: String) -> String {
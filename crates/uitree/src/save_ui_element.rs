@@ -2,13 +2,17 @@
 
 use uiautomation::{UIAutomation, UIElement};
 use uiautomation::types::Handle;
+use crate::conversion::ConvertFromControlType;
 use log::{debug, info, warn, error};
 
 #[derive(Debug, Clone)]
 pub struct SaveUIElement {
     name: String,
+    // false if the name could not be read, as opposed to an element without a name
+    name_available: bool,
     classname: String,
-    control_type: String,
+    // interned: control types are a closed set, so each element refers to a static name
+    control_type: &'static str,
     localized_control_type: String,
     framework_id: String,
     runtime_id: Vec<i32>,
@@ -32,11 +36,14 @@ impl SaveUIElement {
     pub fn get_name(&self) -> &String {
         &self.name
     } 
+    pub fn is_name_available(&self) -> bool {
+        self.name_available
+    }
     pub fn get_classname(&self) -> &String {
         &self.classname
     }
-    pub fn get_control_type(&self) -> &String {
-        &self.control_type
+    pub fn get_control_type(&self) -> &str {
+        self.control_type
     }
     pub fn get_localized_control_type(&self) -> &String {
         &self.localized_control_type
@@ -109,13 +116,13 @@ impl SaveUIElement {
 impl From<UIElement> for SaveUIElement {
     fn from(item: UIElement) -> Self {
 
-        let name: String = item.get_name().unwrap_or("".to_string());
+        let (name, name_available): (String, bool) = match item.get_name() {
+            Ok(name) => (name, true),
+            Err(_) => ("".to_string(), false),
+        };
         let classname: String = item.get_classname().unwrap_or("".to_string());
         
-        let mut control_type: String = "".to_string();
-        if let Ok(ctrl_type) =  item.get_control_type() {
-            control_type = ctrl_type.to_string();    
-        }
+        let control_type: &'static str = item.get_control_type().map(|ctrl_type| ctrl_type.as_str()).unwrap_or("");
 
         let localized_control_type: String = item.get_localized_control_type().unwrap_or("".to_string());
         let framework_id: String = item.get_framework_id().unwrap_or("".to_string());
@@ -128,6 +135,7 @@ impl From<UIElement> for SaveUIElement {
         
         SaveUIElement {
             name,
+            name_available,
             classname,
             control_type,
             localized_control_type,
@@ -1,9 +1,8 @@
-use crate::conversion::ConvertFromControlType;
 
 use crate::save_ui_element::SaveUIElement;
 
 // use crate::commons::FileWriter;
-use crate::{printfmt, UITreeMap};
+use crate::{printfmt, UITreeMap, UIHashMap};
 use xmlutil::xml::{XMLDomWriter, XMLDomNode};
 use xmlutil::xpath_gen::get_xpath_full_from_runtime_id; //get_xpath_from_runtime_id, 
 use xmlutil::xpath_eval::eval_xpath;
@@ -12,6 +11,7 @@ use xmlutil::XpathQueryResult;
 
 
 use std::sync::mpsc::Sender;
+use std::sync::{Arc, RwLock};
 
 use uiautomation::core::UIAutomation;
 use uiautomation::{UIElement, UITreeWalker};
@@ -42,11 +42,15 @@ pub struct UITree {
     tree: UITreeMap<SaveUIElement>,
     xml_dom_tree: String,
     ui_elements: Vec<UIElementInTree>,
+    // XPath -> runtime id of the single matching element (None if the XPath does not
+    // resolve to exactly one element). The tree never changes once built, so results
+    // stay valid for its lifetime; a refresh builds a new tree with an empty cache.
+    xpath_cache: Arc<RwLock<UIHashMap<String, Option<String>>>>,
 }
 
 impl UITree {
     pub fn new(tree: UITreeMap<SaveUIElement>, xml_dom_tree: String, ui_elements: Vec<UIElementInTree>) -> Self {
-        UITree {tree, xml_dom_tree, ui_elements} 
+        UITree {tree, xml_dom_tree, ui_elements, xpath_cache: Arc::new(RwLock::new(UIHashMap::default()))} 
     }
 
     pub fn get_tree(&self) -> &UITreeMap<SaveUIElement> {
@@ -94,6 +98,25 @@ impl UITree {
 
     pub fn get_element_by_xpath(&self, xpath: &str) -> Option<&SaveUIElement> {
 
+        // Evaluating an XPath parses the whole XML DOM tree, so resolved XPaths are cached
+        let cached = self.xpath_cache.read().ok().and_then(|cache| cache.get(xpath).cloned());
+        let runtime_id = match cached {
+            Some(runtime_id) => runtime_id,
+            None => {
+                let runtime_id = self.eval_runtime_id_for_xpath(xpath);
+                if let Ok(mut cache) = self.xpath_cache.write() {
+                    cache.insert(xpath.to_string(), runtime_id.clone());
+                }
+                runtime_id
+            }
+        };
+
+        let ui_elem = self.get_tree().get_element_by_runtime_id(runtime_id?.as_str())?;
+        Some(ui_elem.data.get_element())
+    }
+
+    fn eval_runtime_id_for_xpath(&self, xpath: &str) -> Option<String> {
+
         // Patch the xpath with /@RtID if it is missing
         let xpath = if !xpath.ends_with("/@RtID") {xpath.to_string() + "/@RtID"} else {xpath.to_string()};
 
@@ -105,10 +128,7 @@ impl UITree {
                 let items = xpath_result.get_result_items();
                 let default_result = &XpathQueryResult::default();
                 let itm = items.get(0).unwrap_or(default_result);
-                let runtime_id = itm.get_item_value();
-                let ui_elem = self.get_tree().get_element_by_runtime_id(runtime_id).unwrap();
-                let ui_elem = ui_elem.data.get_element();
-                return Some(ui_elem);
+                return Some(itm.get_item_value().to_string());
             },
             _ => {
                 printfmt!("Warning: XPath expression returned {} results, expected only 1 result. Returning the first result.", xpath_result.get_result_count());
@@ -184,17 +204,6 @@ fn get_element(mut tree: &mut UITreeMap<SaveUIElement>, mut ui_elements: &mut Ve
         }    
     }
 
-    if let Some(caption) = &calling_window_caption {
-        if let Ok(name) = element.get_name() {
-            if name == *caption {
-                // printfmt!("Skipping element with caption: {}", caption);
-                return;
-            }
-        }
-    }
-
-    let runtime_id = element.get_runtime_id().unwrap_or(vec![0, 0, 0, 0]).iter().map(|x| x.to_string()).collect::<Vec<String>>().join("-");
-    let item = format!("'{}' {} ({} | {} | {})", element.get_name().unwrap_or_default(), element.get_localized_control_type().unwrap_or_default(), element.get_classname().unwrap_or_default(), element.get_framework_id().unwrap_or_default(), runtime_id);
     let ui_elem_props: SaveUIElement;
 
     if level == 0 {
@@ -203,14 +212,34 @@ fn get_element(mut tree: &mut UITreeMap<SaveUIElement>, mut ui_elements: &mut Ve
     } else {
         ui_elem_props = SaveUIElement::new(element.clone(), level, z_order);
     }
+
+    // The properties were read once into ui_elem_props; reuse them instead of querying UIA again
+    if let Some(caption) = &calling_window_caption {
+        if ui_elem_props.is_name_available() && ui_elem_props.get_name() == caption {
+            // printfmt!("Skipping element with caption: {}", caption);
+            return;
+        }
+    }
+
+    let runtime_id = match ui_elem_props.get_runtime_id().as_slice() {
+        [] => "0-0-0-0".to_string(),
+        ids => ids.iter().map(|x| x.to_string()).collect::<Vec<String>>().join("-"),
+    };
+    let item = format!("'{}' {} ({} | {} | {})", ui_elem_props.get_name(), ui_elem_props.get_localized_control_type(), ui_elem_props.get_classname(), ui_elem_props.get_framework_id(), runtime_id);
+    let control_type = match ui_elem_props.get_control_type() {
+        "" => "Custom",
+        control_type => control_type,
+    };
     
     let parent = tree.add_child(parent, item.as_str(), &runtime_id.as_str(), ui_elem_props.clone());
-    let ui_elem_in_tree = UIElementInTree::new(ui_elem_props, parent);
-    ui_elements.push(ui_elem_in_tree);
         
-    let curr_xml_dom_node = xml_dom_node.add_child(XMLDomNode::new(element.get_control_type().unwrap().as_str()));
+    let curr_xml_dom_node = xml_dom_node.add_child(XMLDomNode::new(control_type));
     curr_xml_dom_node.set_attribute("RtID", runtime_id.as_str());
-    curr_xml_dom_node.set_attribute("Name", element.get_name().unwrap_or("No name defined".to_string()).as_str());
+    let name = if ui_elem_props.is_name_available() { ui_elem_props.get_name().as_str() } else { "No name defined" };
+    curr_xml_dom_node.set_attribute("Name", name);
+
+    let ui_elem_in_tree = UIElementInTree::new(ui_elem_props, parent);
+    ui_elements.push(ui_elem_in_tree);
     
 
     // Walking the children of the current element